@@ -2,7 +2,7 @@ import streamlit as st
 import os
 from pathlib import Path
 from src.tools.pdf_processor import LeaseDocumentProcessor
-from src.tools.embeddings import VectorStoreManager
+from src.tools.embeddings import get_vector_store_manager
 from src.agents.supervisor import run_analysis
 
 # Page config
@@ -69,7 +69,7 @@ with st.sidebar:
 
                     # Create vector store
                     collection_name = f"user_lease_{uploaded_file.name.replace('.pdf', '').replace(' ', '_')}"
-                    vsm = VectorStoreManager()
+                    vsm = get_vector_store_manager()
                     vsm.create_lease_vectorstore(chunks, collection_name)
 
                     # Update session state
@@ -1,10 +1,10 @@
 from dotenv import load_dotenv
 load_dotenv()
 
-from langchain_openai import ChatOpenAI
-from langchain_core.prompts import ChatPromptTemplate
 from src.utils.state import LeaseAnalysisState
-from src.utils.prompts import CLASSIFIER_PROMPT
+from src.utils.prompts import CLASSIFIER_PROMPT_TMPL
+from src.utils.json_utils import parse_llm_json
+from src.utils.llm import get_chat_model
 import json
 import yaml
 
@@ -35,20 +35,16 @@ def classifier_node(state: LeaseAnalysisState) -> dict:
     print("[Classifier] Classifier: Determining query scope...")
 
     # Use fast model for classification
-    llm = ChatOpenAI(
-        model=config["models"]["fast_model"],
-        temperature=0
-    )
+    llm = get_chat_model(config["models"]["fast_model"], temperature=0)
 
-    prompt = ChatPromptTemplate.from_template(CLASSIFIER_PROMPT)
-    chain = prompt | llm
+    chain = CLASSIFIER_PROMPT_TMPL | llm
 
     # Classify query
     response = chain.invoke({"query": state["user_query"]})
 
     # Parse JSON response
     try:
-        result = json.loads(response.content)
+        result = parse_llm_json(response.content)
 
         # Validate structure
         assert "category" in result, "Missing 'category' in response"
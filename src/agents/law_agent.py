@@ -2,7 +2,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from src.utils.state import LeaseAnalysisState
-from src.chains.rag_chain import LawRAG
+from src.chains.rag_chain import get_law_rag
 from src.chains.corrective_rag import CorrectiveRAG
 from src.chains.query_refiner import QueryRefiner
 
@@ -40,10 +40,8 @@ def law_agent_node(state: LeaseAnalysisState):
     else:
         print(f"   [Synthesizer] Original query: '{query}'")
     
-    # Initialize law RAG for user's state
-    law_rag = LawRAG(
-        state=state["state_location"]
-    )
+    # Law RAG for user's state (shared across runs)
+    law_rag = get_law_rag(state["state_location"])
     
     corrective_rag = CorrectiveRAG(base_rag=law_rag)
     
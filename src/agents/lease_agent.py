@@ -2,7 +2,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from src.utils.state import LeaseAnalysisState
-from src.chains.rag_chain import LeaseRAG
+from src.chains.rag_chain import get_lease_rag
 from src.chains.corrective_rag import CorrectiveRAG
 from src.chains.query_refiner import QueryRefiner
 
@@ -40,10 +40,8 @@ def lease_agent_node(state: LeaseAnalysisState):
     else:
         print(f"   [Synthesizer] Original query: '{query}'")
     
-    # Initialize lease RAG with corrective capabilities
-    lease_rag = LeaseRAG(
-        collection_name=state["lease_collection_name"]
-    )
+    # Lease RAG for user's lease (shared across runs), with corrective capabilities
+    lease_rag = get_lease_rag(state["lease_collection_name"])
     
     corrective_rag = CorrectiveRAG(base_rag=lease_rag)
     
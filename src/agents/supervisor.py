@@ -1,6 +1,8 @@
 from dotenv import load_dotenv
 load_dotenv()
 
+from functools import lru_cache
+from typing import List
 from langgraph.graph import StateGraph, END
 from src.utils.state import LeaseAnalysisState
 from src.agents.classifier_agent import classifier_node
@@ -8,6 +10,7 @@ from src.agents.lease_agent import lease_agent_node
 from src.agents.law_agent import law_agent_node
 from src.agents.verifier_agent import verifier_agent_node
 from src.agents.synthesis_agent import synthesis_agent_node
+from src.tools.embeddings import get_vector_store_manager
 
 # CRITICAL: Maximum iterations to prevent infinite loops
 MAX_ITERATIONS = 3
@@ -185,6 +188,31 @@ def build_graph():
     # Compile and return
     return graph.compile()
 
+@lru_cache(maxsize=1)
+def get_graph():
+    """Compiled graph, built once per process and reused across analyses"""
+    return build_graph()
+
+def _check_lease_collection(lease_collection_name: str):
+    """Fail before any LLM call if the lease was never indexed"""
+    if not get_vector_store_manager().collection_exists(lease_collection_name):
+        raise LookupError(f"Lease collection '{lease_collection_name}' does not exist")
+
+def _initial_state(
+    user_query: str,
+    lease_collection_name: str,
+    state_location: str
+) -> dict:
+    """Starting state for one analysis run"""
+    return {
+        "user_query": user_query,
+        "current_query": user_query,  # Will be refined if needed
+        "lease_collection_name": lease_collection_name,
+        "state_location": state_location,
+        "requery_count": 0,
+        "needs_requery": False
+    }
+
 def run_analysis(
     user_query: str,
     lease_collection_name: str,
@@ -200,25 +228,23 @@ def run_analysis(
         
     Returns:
         Final state with answer and metadata
+        
+    Raises:
+        LookupError: If the lease collection does not exist
     """
     
+    _check_lease_collection(lease_collection_name)
+    
     print("=" * 60)
     print("Starting LeaseLogic analysis...")
     print(f"Query: {user_query}")
     print("=" * 60)
     
-    # Build the graph
-    app = build_graph()
+    # Reuse the compiled graph
+    app = get_graph()
     
     # Initialize state
-    initial_state = {
-        "user_query": user_query,
-        "current_query": user_query,  # Will be refined if needed
-        "lease_collection_name": lease_collection_name,
-        "state_location": state_location,
-        "requery_count": 0,
-        "needs_requery": False
-    }
+    initial_state = _initial_state(user_query, lease_collection_name, state_location)
     
     # Run the graph
     final_state = app.invoke(initial_state)
@@ -229,6 +255,82 @@ def run_analysis(
     
     return final_state
 
+def run_analysis_batch(
+    user_queries: List[str],
+    lease_collection_name: str,
+    state_location: str = "california"
+) -> List[dict]:
+    """
+    Run several analyses against the same lease and state.
+    
+    All queries share one compiled graph and run concurrently through
+    the graph's batch(), so total time tracks the slowest query.
+    
+    Args:
+        user_queries: Questions about the lease
+        lease_collection_name: Name of ChromaDB collection for user's lease
+        state_location: State for law lookup (default: california)
+        
+    Returns:
+        Final states, in the same order as user_queries
+        
+    Raises:
+        LookupError: If the lease collection does not exist
+    """
+    
+    _check_lease_collection(lease_collection_name)
+    
+    print("=" * 60)
+    print(f"Starting LeaseLogic batch analysis ({len(user_queries)} queries)...")
+    print("=" * 60)
+    
+    final_states = get_graph().batch([
+        _initial_state(query, lease_collection_name, state_location)
+        for query in user_queries
+    ])
+    
+    print("=" * 60)
+    print("Batch analysis complete!")
+    print("=" * 60)
+    
+    return final_states
+
+async def run_analysis_async(
+    user_query: str,
+    lease_collection_name: str,
+    state_location: str = "california"
+):
+    """
+    Async counterpart of run_analysis.
+    
+    Uses the graph's ainvoke(), so several analyses can be awaited
+    together (e.g. with asyncio.gather) and overlap their LLM and
+    retrieval round-trips.
+    
+    Args:
+        user_query: User's question about their lease
+        lease_collection_name: Name of ChromaDB collection for user's lease
+        state_location: State for law lookup (default: california)
+        
+    Returns:
+        Final state with answer and metadata
+        
+    Raises:
+        LookupError: If the lease collection does not exist
+    """
+    
+    _check_lease_collection(lease_collection_name)
+    
+    print(f"Starting LeaseLogic analysis: {user_query}")
+    
+    final_state = await get_graph().ainvoke(
+        _initial_state(user_query, lease_collection_name, state_location)
+    )
+    
+    print(f"Analysis complete: {user_query}")
+    
+    return final_state
+
 
 # For testing
 if __name__ == "__main__":
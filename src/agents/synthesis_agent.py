@@ -1,13 +1,12 @@
 from dotenv import load_dotenv
 load_dotenv()
 
-from langchain_openai import ChatOpenAI
 from src.utils.state import LeaseAnalysisState
+from src.utils.llm import get_chat_model
 from src.utils.prompts import (
-    SYNTHESIS_PROMPT,
-    SYNTHESIS_LEASE_ONLY_PROMPT,
-    SYNTHESIS_LAW_ONLY_PROMPT,
-    SYNTHESIS_COMPARISON_PROMPT
+    SYNTHESIS_LEASE_ONLY_PROMPT_TMPL,
+    SYNTHESIS_LAW_ONLY_PROMPT_TMPL,
+    SYNTHESIS_COMPARISON_PROMPT_TMPL
 )
 
 def synthesis_agent_node(state: LeaseAnalysisState):
@@ -33,33 +32,30 @@ def synthesis_agent_node(state: LeaseAnalysisState):
     print(f"   Synthesis scope: {scope}")
 
     # Use best model for synthesis
-    llm = ChatOpenAI(
-        model="gpt-4o",  # Best model for complex synthesis
+    llm = get_chat_model(
+        "gpt-4o",  # Best model for complex synthesis
         temperature=0.3   # Slight creativity for natural language
     )
 
     # Choose appropriate prompt based on scope
     if scope == "lease_only":
-        prompt_template = SYNTHESIS_LEASE_ONLY_PROMPT
-        synthesis_input = prompt_template.format(
-            user_query=state["user_query"],
-            lease_finding=state.get("lease_finding", "No lease information found.")
-        )
+        synthesis_input = SYNTHESIS_LEASE_ONLY_PROMPT_TMPL.invoke({
+            "user_query": state["user_query"],
+            "lease_finding": state.get("lease_finding", "No lease information found.")
+        })
     elif scope == "law_only":
-        prompt_template = SYNTHESIS_LAW_ONLY_PROMPT
-        synthesis_input = prompt_template.format(
-            user_query=state["user_query"],
-            law_finding=state.get("law_finding", "No law information found."),
-            state=state["state_location"].title()
-        )
+        synthesis_input = SYNTHESIS_LAW_ONLY_PROMPT_TMPL.invoke({
+            "user_query": state["user_query"],
+            "law_finding": state.get("law_finding", "No law information found."),
+            "state": state["state_location"].title()
+        })
     else:  # "both"
-        prompt_template = SYNTHESIS_COMPARISON_PROMPT
-        synthesis_input = prompt_template.format(
-            user_query=state["user_query"],
-            lease_finding=state.get("lease_finding", "No lease information found."),
-            law_finding=state.get("law_finding", "No law information found."),
-            state=state["state_location"].title()
-        )
+        synthesis_input = SYNTHESIS_COMPARISON_PROMPT_TMPL.invoke({
+            "user_query": state["user_query"],
+            "lease_finding": state.get("lease_finding", "No lease information found."),
+            "law_finding": state.get("law_finding", "No law information found."),
+            "state": state["state_location"].title()
+        })
 
     # Generate final answer
     response = llm.invoke(synthesis_input)
@@ -1,6 +1,7 @@
-from langchain_openai import ChatOpenAI
-from langchain_core.prompts import ChatPromptTemplate
-from src.utils.prompts import RETRIEVAL_GRADER_PROMPT, QUERY_REFINEMENT_PROMPT
+from src.utils.prompts import RETRIEVAL_GRADER_PROMPT_TMPL, QUERY_REFINEMENT_PROMPT_TMPL
+from src.utils.json_utils import parse_llm_json
+from src.utils.llm import get_chat_model
+from functools import lru_cache
 from typing import Dict, List
 import json
 import yaml
@@ -9,15 +10,28 @@ import yaml
 with open("config/config.yaml", "r") as f:
     config = yaml.safe_load(f)
 
+@lru_cache(maxsize=512)
+def _grader_response(model: str, query: str, documents: str) -> str:
+    """
+    Raw grader reply for a query and its formatted documents.
+    
+    Grading runs at temperature 0, so regrading the same retrieval
+    (repeated queries, tests) reuses the first reply instead of making
+    another LLM call.
+    """
+    chain = RETRIEVAL_GRADER_PROMPT_TMPL | get_chat_model(model, temperature=0)
+    response = chain.invoke({
+        "query": query,
+        "documents": documents
+    })
+    return response.content
+
 class RetrievalGrader:
     """Grades quality of retrieved documents"""
     
     def __init__(self):
         """Initialize grader with fast model"""
-        self.llm = ChatOpenAI(
-            model=config["models"]["fast_model"],
-            temperature=0
-        )
+        self.model = config["models"]["fast_model"]
     
     def grade(self, query: str, retrieved_docs: List[Dict]) -> Dict:
         """
@@ -37,19 +51,12 @@ class RetrievalGrader:
         # Format documents for grading
         docs_str = self._format_docs_for_grading(retrieved_docs)
         
-        # Create prompt
-        prompt = ChatPromptTemplate.from_template(RETRIEVAL_GRADER_PROMPT)
-        chain = prompt | self.llm
-        
-        # Get grading
-        response = chain.invoke({
-            "query": query,
-            "documents": docs_str
-        })
+        # Get grading (cached per model, query and formatted documents)
+        content = _grader_response(self.model, query, docs_str)
         
         # Parse JSON response
         try:
-            result = json.loads(response.content)
+            result = parse_llm_json(content)
             
             # Validate structure
             assert "grade" in result, "Missing 'grade' in response"
@@ -106,8 +113,8 @@ class QueryRefiner:
     
     def __init__(self):
         """Initialize refiner"""
-        self.llm = ChatOpenAI(
-            model=config["models"]["fast_model"],
+        self.llm = get_chat_model(
+            config["models"]["fast_model"],
             temperature=0.3  # Slight creativity for reformulation
         )
     
@@ -175,8 +182,7 @@ class QueryRefiner:
     
     def _llm_refinement(self, original_query: str, issue: str, iteration: int) -> str:
         """Use LLM to refine query"""
-        prompt = ChatPromptTemplate.from_template(QUERY_REFINEMENT_PROMPT)
-        chain = prompt | self.llm
+        chain = QUERY_REFINEMENT_PROMPT_TMPL | self.llm
 
         response = chain.invoke({
             "original_query": original_query,
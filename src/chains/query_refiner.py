@@ -8,7 +8,7 @@ quality is insufficient. Uses different strategies based on iteration.
 from dotenv import load_dotenv
 load_dotenv()
 
-from langchain_openai import ChatOpenAI
+from src.utils.llm import get_chat_model
 from langchain_core.prompts import ChatPromptTemplate
 
 class QueryRefiner:
@@ -17,8 +17,8 @@ class QueryRefiner:
     def __init__(self):
         """Initialize query refiner with LLM"""
         
-        self.llm = ChatOpenAI(
-            model="gpt-4o-mini",
+        self.llm = get_chat_model(
+            "gpt-4o-mini",
             temperature=0.3  # Some creativity for rephrasing
         )
         
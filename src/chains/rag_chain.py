@@ -1,8 +1,9 @@
 from langchain_core.runnables import RunnablePassthrough
-from langchain_openai import ChatOpenAI
-from langchain_core.prompts import ChatPromptTemplate
-from src.tools.embeddings import VectorStoreManager
-from src.utils.prompts import LEASE_ANALYZER_PROMPT, LAW_ANALYZER_PROMPT
+from src.tools.embeddings import get_vector_store_manager
+from src.utils.llm import get_chat_model
+from src.utils.prompts import LEASE_ANALYZER_PROMPT_TMPL, LAW_ANALYZER_PROMPT_TMPL
+from functools import lru_cache
+import asyncio
 from typing import Dict, List
 import yaml
 
@@ -20,10 +21,10 @@ class LeaseRAG:
         Args:
             collection_name: ChromaDB collection name for user's lease
         """
-        self.vsm = VectorStoreManager()
+        self.vsm = get_vector_store_manager()
         self.collection_name = collection_name
-        self.llm = ChatOpenAI(
-            model=config["models"]["fast_model"],  # gpt-4o-mini
+        self.llm = get_chat_model(
+            config["models"]["fast_model"],  # gpt-4o-mini
             temperature=0  # Deterministic for analysis
         )
         self.retrieval_k = config["rag"]["retrieval_k"]
@@ -67,11 +68,8 @@ class LeaseRAG:
             for doc in retrieved_docs
         ])
 
-        # Create prompt
-        prompt = ChatPromptTemplate.from_template(LEASE_ANALYZER_PROMPT)
-
         # Generate analysis
-        chain = prompt | self.llm
+        chain = LEASE_ANALYZER_PROMPT_TMPL | self.llm
         response = chain.invoke({
             "context": context_str,
             "question": query
@@ -103,6 +101,21 @@ class LeaseRAG:
             "analysis": analysis,
             "retrieval_score": avg_score
         }
+    
+    async def run_many(self, queries: List[str]) -> List[Dict]:
+        """
+        Run several independent queries concurrently.
+        
+        Each query's retrieval and LLM call runs in a worker thread, so
+        total time tracks the slowest query instead of the sum.
+        
+        Args:
+            queries: User questions
+            
+        Returns:
+            run() results, in the same order as queries
+        """
+        return await asyncio.gather(*(asyncio.to_thread(self.run, q) for q in queries))
 
 class LawRAG:
     """RAG chain for analyzing state law"""
@@ -114,13 +127,10 @@ class LawRAG:
         Args:
             state: State whose laws to search
         """
-        self.vsm = VectorStoreManager()
+        self.vsm = get_vector_store_manager()
         self.state = state
         self.collection_name = f"{state}_laws"
-        self.llm = ChatOpenAI(
-            model=config["models"]["fast_model"],
-            temperature=0
-        )
+        self.llm = get_chat_model(config["models"]["fast_model"], temperature=0)
         # Use fewer results for laws since each section is comprehensive
         self.retrieval_k = 3
     
@@ -158,8 +168,7 @@ class LawRAG:
 
         context_str = "\n\n".join(formatted_docs)
 
-        prompt = ChatPromptTemplate.from_template(LAW_ANALYZER_PROMPT)
-        chain = prompt | self.llm
+        chain = LAW_ANALYZER_PROMPT_TMPL | self.llm
 
         response = chain.invoke({
             "state": self.state.title(),
@@ -181,6 +190,20 @@ class LawRAG:
             "analysis": analysis,
             "retrieval_score": avg_score
         }
+    
+    async def run_many(self, queries: List[str]) -> List[Dict]:
+        """Run several independent queries concurrently (see LeaseRAG.run_many)"""
+        return await asyncio.gather(*(asyncio.to_thread(self.run, q) for q in queries))
+
+@lru_cache(maxsize=None)
+def get_lease_rag(collection_name: str) -> LeaseRAG:
+    """Shared LeaseRAG per lease collection (chains hold no per-query state)"""
+    return LeaseRAG(collection_name)
+
+@lru_cache(maxsize=None)
+def get_law_rag(state: str = "california") -> LawRAG:
+    """Shared LawRAG per state (chains hold no per-query state)"""
+    return LawRAG(state)
 
 # Testing
 if __name__ == "__main__":
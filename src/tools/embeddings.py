@@ -1,3 +1,9 @@
+import hashlib
+import os
+import sqlite3
+from array import array
+from functools import lru_cache
+from langchain_core.embeddings import Embeddings
 from langchain_openai import OpenAIEmbeddings
 from langchain_chroma import Chroma
 from typing import List, Dict, Optional
@@ -6,6 +12,77 @@ from chromadb.config import Settings
 from dotenv import load_dotenv
 load_dotenv()
 
+class CachedEmbeddings(Embeddings):
+    """
+    Document embeddings cached on disk by SHA-256 of model name and chunk text.
+    
+    Rebuilding a collection from the same (or a mostly unchanged) lease
+    only calls the embedding model for chunks it hasn't seen before. The
+    cache is a SQLite database in WAL mode, so concurrent builds in other
+    threads or processes (e.g. pytest -n auto workers) can share it.
+    """
+    
+    def __init__(self, embeddings: Embeddings, cache_path: str, model: str):
+        """
+        Args:
+            embeddings: Underlying embedding model
+            cache_path: SQLite file holding sha256(model, text) -> vector rows
+            model: Embedding model name; switching models never reuses
+                another model's vectors
+        """
+        self.embeddings = embeddings
+        self.cache_path = cache_path
+        self.model = model
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+        finally:
+            conn.close()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """New connection per operation, since connections can't cross threads"""
+        return sqlite3.connect(self.cache_path, timeout=30)
+    
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys = [
+            hashlib.sha256(f"{self.model}\0{text}".encode("utf-8")).hexdigest()
+            for text in texts
+        ]
+        
+        conn = self._connect()
+        try:
+            rows = [
+                conn.execute("SELECT vector FROM embeddings WHERE key = ?", (key,)).fetchone()
+                for key in keys
+            ]
+        finally:
+            conn.close()
+        vectors = [array("d", row[0]).tolist() if row else None for row in rows]
+        
+        # Embed each unseen text once, even if it repeats in this call. The
+        # API call runs with no connection open so concurrent builds overlap.
+        missing = {key: text for key, text, vector in zip(keys, texts, vectors) if vector is None}
+        if missing:
+            new_vectors = dict(zip(missing, self.embeddings.embed_documents(list(missing.values()))))
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                        [(key, array("d", vector).tobytes()) for key, vector in new_vectors.items()]
+                    )
+            finally:
+                conn.close()
+            vectors = [new_vectors.get(key, vector) for key, vector in zip(keys, vectors)]
+        
+        return vectors
+    
+    def embed_query(self, text: str) -> List[float]:
+        return self.embeddings.embed_query(text)
+
 class VectorStoreManager:
     """Manages vector stores for leases and laws"""
     
@@ -21,11 +98,26 @@ class VectorStoreManager:
             model="text-embedding-3-small"  # $0.02 per 1M tokens
         )
         
-        # Initialize ChromaDB client
-        self.chroma_client = chromadb.Client(Settings(
-            persist_directory=persist_directory,
-            anonymized_telemetry=False
-        ))
+        # Repeated queries (requery loops, tests) skip the embedding API call
+        self.embed_query = lru_cache(maxsize=4096)(self.embeddings.embed_query)
+        
+        # Unchanged chunks skip the embedding API call when a collection is rebuilt
+        os.makedirs(persist_directory, exist_ok=True)
+        self.document_embeddings = CachedEmbeddings(
+            self.embeddings,
+            os.path.join(persist_directory, "embedding_cache.sqlite3"),
+            model=self.embeddings.model
+        )
+        
+        # One persistent ChromaDB client shared by every vector store this
+        # manager opens, so listing/deleting sees the collections on disk
+        self.chroma_client = chromadb.PersistentClient(
+            path=persist_directory,
+            settings=Settings(anonymized_telemetry=False)
+        )
+        
+        # Open Chroma stores by collection name, reused across searches
+        self._vectorstores: Dict[str, Chroma] = {}
     
     def create_lease_vectorstore(
         self, 
@@ -35,49 +127,121 @@ class VectorStoreManager:
         """
         Create vector store from processed lease chunks.
         
+        If every chunk carries a stable 'id' (e.g. a content hash), an
+        existing collection is synced instead of rebuilt: only new chunks
+        are added and chunks no longer present are deleted.
+        
         Args:
             chunks: List of dicts with 'text' and 'metadata' keys
+                (and optionally 'id')
             collection_name: Name for the Chroma collection
             
         Returns:
             Chroma vector store instance
         """
+        if chunks and all(chunk.get("id") for chunk in chunks):
+            return self._sync_vectorstore(chunks, collection_name)
+        
         # Extract texts and metadatas
         texts = [chunk["text"] for chunk in chunks]
         metadatas = [chunk["metadata"] for chunk in chunks]
         
         print(f"Creating embeddings for {len(texts)} chunks...")
         
-        # Create vector store
+        # Create vector store (chunk embeddings come from the on-disk cache)
         vectorstore = Chroma.from_texts(
             texts=texts,
-            embedding=self.embeddings,
+            embedding=self.document_embeddings,
             metadatas=metadatas,
             collection_name=collection_name,
-            persist_directory=self.persist_directory
+            client=self.chroma_client
         )
                 
         print(f"✓ Vector store '{collection_name}' created with {len(texts)} embeddings")
         
+        self._vectorstores[collection_name] = vectorstore
+        return vectorstore
+    
+    def _sync_vectorstore(self, chunks: List[Dict], collection_name: str) -> Chroma:
+        """Make a collection hold exactly the given id'd chunks, embedding only new ones"""
+        vectorstore = Chroma(
+            collection_name=collection_name,
+            embedding_function=self.document_embeddings,
+            client=self.chroma_client
+        )
+        
+        chunks_by_id = {chunk["id"]: chunk for chunk in chunks}
+        existing = set(vectorstore.get(include=[])["ids"])
+        
+        stale = list(existing - chunks_by_id.keys())
+        if stale:
+            vectorstore.delete(ids=stale)
+        
+        new = [chunk for chunk_id, chunk in chunks_by_id.items() if chunk_id not in existing]
+        if new:
+            print(f"Creating embeddings for {len(new)} new chunks...")
+            vectorstore.add_texts(
+                texts=[chunk["text"] for chunk in new],
+                metadatas=[chunk["metadata"] for chunk in new],
+                ids=[chunk["id"] for chunk in new]
+            )
+        
+        print(
+            f"✓ Vector store '{collection_name}' synced: {len(chunks_by_id)} embeddings "
+            f"({len(new)} added, {len(stale)} removed)"
+        )
+        
+        self._vectorstores[collection_name] = vectorstore
         return vectorstore
     
     def load_vectorstore(self, collection_name: str) -> Chroma:
         """
         Load existing vector store from disk.
         
+        The store is opened once per collection and reused afterwards.
+        A missing collection raises instead of being created empty, so a
+        search can never make collection_exists() report it as built.
+        
         Args:
             collection_name: Name of collection to load
             
         Returns:
             Chroma vector store instance
+            
+        Raises:
+            LookupError: If the collection does not exist or is empty
         """
-        vectorstore = Chroma(
-            collection_name=collection_name,
-            embedding_function=self.embeddings,
-            persist_directory=self.persist_directory
-        )
+        vectorstore = self._vectorstores.get(collection_name)
+        if vectorstore is None:
+            if not self.collection_exists(collection_name):
+                raise LookupError(f"Collection '{collection_name}' does not exist")
+            vectorstore = Chroma(
+                collection_name=collection_name,
+                embedding_function=self.embeddings,
+                client=self.chroma_client
+            )
+            self._vectorstores[collection_name] = vectorstore
         return vectorstore
     
+    def list_collections(self) -> List[str]:
+        """Names of every stored collection, including empty ones"""
+        # list_collections() returns names in newer chromadb, objects in older
+        return [
+            getattr(collection, "name", collection)
+            for collection in self.chroma_client.list_collections()
+        ]
+    
+    def collection_exists(self, collection_name: str) -> bool:
+        """
+        Check whether a collection is stored with at least one document.
+        
+        Empty collections (e.g. left behind by older versions that created
+        a collection on first search) count as missing. Nothing is embedded.
+        """
+        if collection_name not in self.list_collections():
+            return False
+        return self.chroma_client.get_collection(collection_name).count() > 0
+    
     def search_lease(
         self,
         query: str,
@@ -99,13 +263,11 @@ class VectorStoreManager:
         """
         vectorstore = self.load_vectorstore(collection_name)
         
-        # Perform search
-        if filter_metadata:
-            results = vectorstore.similarity_search_with_score(
-                query, k=k, filter=filter_metadata
-            )
-        else:
-            results = vectorstore.similarity_search_with_score(query, k=k)
+        # Perform search with the (cached) query embedding; scores are the
+        # same distances similarity_search_with_score returns
+        results = vectorstore.similarity_search_by_vector_with_relevance_scores(
+            self.embed_query(query), k=k, filter=filter_metadata
+        )
         
         # Format results
         formatted_results = []
@@ -118,18 +280,115 @@ class VectorStoreManager:
         
         return formatted_results
     
+    def embed_queries(self, queries: List[str]) -> List[List[float]]:
+        """
+        Embed several queries in one API request.
+        
+        Use with search_by_vectors to search many collections without
+        re-embedding the same query for each one.
+        """
+        return self.embeddings.embed_documents(queries) if queries else []
+    
+    def search_by_vectors(
+        self,
+        query_embeddings: List[List[float]],
+        collection_name: str = "lease_documents",
+        k: int = 5,
+        filter_metadata: Optional[Dict] = None
+    ) -> List[List[Dict]]:
+        """
+        Search with precomputed query embeddings in one Chroma query.
+        
+        Args:
+            query_embeddings: Vectors from embed_queries
+            collection_name: Collection to search
+            k: Number of results per query
+            filter_metadata: e.g., {"section": "rent_payment"}
+            
+        Returns:
+            One result list per vector (same format as search_lease)
+            
+        Raises:
+            LookupError: If the collection does not exist or is empty
+        """
+        if not query_embeddings:
+            return []
+        
+        if not self.collection_exists(collection_name):
+            raise LookupError(f"Collection '{collection_name}' does not exist")
+        
+        # Query the chromadb collection directly (public API) so every
+        # vector goes out in a single request
+        query_kwargs = {
+            "query_embeddings": query_embeddings,
+            "n_results": k,
+            "include": ["documents", "metadatas", "distances"],
+        }
+        if filter_metadata:
+            query_kwargs["where"] = filter_metadata
+        results = self.chroma_client.get_collection(collection_name).query(**query_kwargs)
+        
+        return [
+            [
+                {"text": text, "metadata": metadata, "score": float(distance)}
+                for text, metadata, distance in zip(texts, metadatas, distances)
+            ]
+            for texts, metadatas, distances in zip(
+                results["documents"], results["metadatas"], results["distances"]
+            )
+        ]
+    
+    def search_lease_batch(
+        self,
+        queries: List[str],
+        collection_name: str = "lease_documents",
+        k: int = 5,
+        filter_metadata: Optional[Dict] = None
+    ) -> List[List[Dict]]:
+        """
+        Search several queries with one embedding call and one Chroma query.
+        
+        Args:
+            queries: Search queries
+            collection_name: Collection to search
+            k: Number of results per query
+            filter_metadata: e.g., {"section": "rent_payment"}
+            
+        Returns:
+            One result list per query (same format as search_lease)
+        """
+        return self.search_by_vectors(
+            self.embed_queries(queries), collection_name, k, filter_metadata
+        )
+    
     def delete_collection(self, collection_name: str):
         """Delete a collection from ChromaDB"""
+        self._vectorstores.pop(collection_name, None)
         try:
             self.chroma_client.delete_collection(collection_name)
             print(f"✓ Deleted collection '{collection_name}'")
         except Exception as e:
             print(f"Error deleting collection: {e}")
 
+@lru_cache(maxsize=None)
+def get_vector_store_manager(persist_directory: str = "./data/vector_stores") -> VectorStoreManager:
+    """
+    Shared VectorStoreManager per persist directory.
+    
+    Reuses one embeddings client, Chroma client and query-embedding cache
+    instead of rebuilding them for every chain, test or request.
+    
+    Args:
+        persist_directory: Where ChromaDB collections are stored
+        
+    Returns:
+        The process-wide VectorStoreManager for that directory
+    """
+    return VectorStoreManager(persist_directory)
+
 # Example usage
 if __name__ == "__main__":
     from pdf_processor import LeaseDocumentProcessor
-    import os
     
     # Process PDF
     processor = LeaseDocumentProcessor()
@@ -1,8 +1,9 @@
 from dotenv import load_dotenv
 load_dotenv()
 
-from src.tools.state_law_database import StateLawDatabase
-from src.tools.embeddings import VectorStoreManager
+from src.tools.state_law_database import StateLawDatabase, get_law_database
+from src.tools.embeddings import get_vector_store_manager
+from hashlib import blake2b
 from typing import List, Dict
 import sys
 
@@ -11,7 +12,8 @@ def create_law_chunks(laws: List[Dict]) -> List[Dict]:
     Convert law sections into chunks for embedding.
     
     Enhanced formatting includes jurisdiction (state vs federal)
-    for better context in retrieval.
+    for better context in retrieval. Each chunk's id is a hash of its
+    text, so rebuilding a state's store only embeds changed sections.
     
     Args:
         laws: List of law dicts from database
@@ -38,8 +40,10 @@ Jurisdiction: {law.get('jurisdiction', 'state')}
 Applies to: {state_display}
 """
         
+        text = combined_text.strip()
         chunks.append({
-            "text": combined_text.strip(),
+            "id": blake2b(text.encode("utf-8"), digest_size=16).hexdigest(),
+            "text": text,
             "metadata": {
                 "section": law['section'],
                 "title": law['title'],
@@ -64,12 +68,12 @@ def build_law_vectorstore(state: str = "california") -> None:
     print(f"{'='*60}")
     
     # Load laws (includes federal automatically)
-    db = StateLawDatabase()
+    db = get_law_database()
     laws = db.get_laws_for_state(state)
     
     # Count state vs federal
-    state_count = len([l for l in laws if l.get('jurisdiction') == 'state'])
-    federal_count = len([l for l in laws if l.get('jurisdiction') == 'federal'])
+    state_count = len(db.filter_laws(laws, jurisdiction='state'))
+    federal_count = len(db.filter_laws(laws, jurisdiction='federal'))
     
     print(f"Loaded {len(laws)} total laws:")
     print(f"  - {state_count} {state} state laws")
@@ -80,7 +84,7 @@ def build_law_vectorstore(state: str = "california") -> None:
     print(f"Created {len(chunks)} law chunks")
     
     # Create vector store
-    vsm = VectorStoreManager()
+    vsm = get_vector_store_manager()
     vectorstore = vsm.create_lease_vectorstore(
         chunks, 
         collection_name=f"{state}_laws"
@@ -144,7 +148,7 @@ def test_law_search(state: str = "california"):
     print(f"Testing {state.upper()} Law Search")
     print(f"{'='*60}")
     
-    vsm = VectorStoreManager()
+    vsm = get_vector_store_manager()
     
     # Test queries designed to match different categories
     test_queries = [
@@ -187,6 +191,9 @@ def test_law_search(state: str = "california"):
         except Exception as e:
             print(f"  [ERROR] Error: {e}")
 
+# A CLI helper, not a pytest test, even when imported into a test module
+test_law_search.__test__ = False
+
 def compare_states(query: str, states: List[str] = None):
     """
     Compare how different states handle the same issue.
@@ -196,7 +203,7 @@ def compare_states(query: str, states: List[str] = None):
         states: List of states to compare (default: all supported)
     """
     db = StateLawDatabase()
-    vsm = VectorStoreManager()
+    vsm = get_vector_store_manager()
     
     if states is None:
         states = db.SUPPORTED_STATES
@@ -1,5 +1,8 @@
 from PyPDF2 import PdfReader
-from typing import List, Dict
+from typing import Callable, List, Dict, Tuple
+from itertools import chain
+import multiprocessing
+import os
 import re
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
@@ -12,6 +15,56 @@ except ImportError:
     OCR_AVAILABLE = False
     print("[WARNING]  OCR not available. Install: pip install pytesseract pdf2image Pillow")
 
+# Below this many pages, starting worker processes costs more than it saves
+PARALLEL_MIN_PAGES = 8
+
+def _extract_pages(pdf_path: str, start: int, stop: int) -> List[str]:
+    """Text layer of pages [start, stop) (0-based)"""
+    reader = PdfReader(pdf_path)
+    return [reader.pages[i].extract_text() for i in range(start, stop)]
+
+def _ocr_pages(pdf_path: str, start: int, stop: int) -> List[str]:
+    """OCR text of pages [start, stop) (0-based), rasterizing only those pages"""
+    images = convert_from_path(pdf_path, dpi=300, first_page=start + 1, last_page=stop)  # Higher DPI = better OCR
+    return [
+        pytesseract.image_to_string(LeaseDocumentProcessor._preprocess_image_for_ocr(image))
+        for image in images
+    ]
+
+def _map_pages(
+    func: Callable[[str, int, int], List[str]],
+    pdf_path: str,
+    num_pages: int
+) -> List[str]:
+    """
+    Run a page-range extractor over the whole PDF.
+    
+    Long PDFs are split into one contiguous page range per CPU and
+    processed in a multiprocessing.Pool (extraction and OCR are CPU-bound,
+    so threads would serialize on the GIL).
+    
+    Returns:
+        Per-page results in page order
+    """
+    workers = min(os.cpu_count() or 1, num_pages)
+    if num_pages < PARALLEL_MIN_PAGES or workers < 2:
+        return func(pdf_path, 0, num_pages)
+    
+    size = -(-num_pages // workers)  # ceil
+    ranges: List[Tuple[str, int, int]] = [
+        (pdf_path, start, min(start + size, num_pages))
+        for start in range(0, num_pages, size)
+    ]
+    with multiprocessing.Pool(len(ranges)) as pool:
+        return list(chain.from_iterable(pool.starmap(func, ranges)))
+
+def _join_pages(page_texts: List[str]) -> str:
+    """Join page texts with the '--- PAGE n ---' markers used for page counts"""
+    return "".join(
+        f"\n--- PAGE {page_num} ---\n{page_text}\n"
+        for page_num, page_text in enumerate(page_texts, 1)
+    )
+
 class LeaseDocumentProcessor:
     """Processes lease PDF documents into structured chunks"""
     
@@ -45,16 +98,11 @@ class LeaseDocumentProcessor:
             Extracted text as string
         """
         # Try normal text extraction first
-        reader = PdfReader(pdf_path)
-        text = ""
-        
-        for page_num, page in enumerate(reader.pages):
-            page_text = page.extract_text()
-            text += f"\n--- PAGE {page_num + 1} ---\n"
-            text += page_text + "\n"
+        num_pages = len(PdfReader(pdf_path).pages)
+        text = _join_pages(_map_pages(_extract_pages, pdf_path, num_pages))
         
         # Check if we got meaningful text
-        text_density = len(text.strip()) / len(reader.pages)
+        text_density = len(text.strip()) / num_pages
         
         # If very little text extracted (scanned PDF), use OCR
         if text_density < 50 or use_ocr:  # Less than 50 chars per page
@@ -66,42 +114,32 @@ class LeaseDocumentProcessor:
                     "Install: pip install pytesseract pdf2image Pillow && brew install tesseract"
                 )
             
-            text = self._extract_text_with_ocr(pdf_path)
+            text = self._extract_text_with_ocr(pdf_path, num_pages)
         
         return text
     
-    def _extract_text_with_ocr(self, pdf_path: str) -> str:
+    def _extract_text_with_ocr(self, pdf_path: str, num_pages: int) -> str:
         """
         Extract text using OCR (for scanned PDFs).
         
+        Pages are rasterized and OCR'd in parallel worker processes.
+        
         Args:
             pdf_path: Path to PDF file
+            num_pages: Number of pages in the PDF
             
         Returns:
             OCR-extracted text
         """
-        print("[Classifier] Running OCR on PDF (this may take a minute)...")
-        
-        # Convert PDF to images
-        images = convert_from_path(pdf_path, dpi=300)  # Higher DPI = better OCR
+        print(f"[Classifier] Running OCR on {num_pages} pages (this may take a minute)...")
         
-        text = ""
-        total_pages = len(images)
-        
-        for page_num, image in enumerate(images, 1):
-            print(f"   Processing page {page_num}/{total_pages}...")
-            
-            # Run OCR on image
-            image = self._preprocess_image_for_ocr(image)
-            page_text = pytesseract.image_to_string(image)
-            
-            text += f"\n--- PAGE {page_num} ---\n"
-            text += page_text + "\n"
+        text = _join_pages(_map_pages(_ocr_pages, pdf_path, num_pages))
         
         print(f"[✓] OCR complete! Extracted {len(text)} characters")
         return text
     
-    def _preprocess_image_for_ocr(self, image):
+    @staticmethod
+    def _preprocess_image_for_ocr(image):
         """Improve OCR accuracy with image preprocessing"""
         from PIL import ImageEnhance, ImageFilter
         
@@ -1,8 +1,261 @@
 import json
-from typing import List, Dict
+import mmap
+import re
+import sys
+from bisect import bisect_left
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Sequence as SequenceABC
+from dataclasses import dataclass
+from functools import cache
+from hashlib import blake2b
+from itertools import chain
+from operator import itemgetter
+from typing import Callable, List, Dict, Iterator, Optional, Sequence, Tuple, Union
 from pathlib import Path
 import os
 
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Tokenization for keyword search over law text
+_TOKEN_RE = re.compile(r"[a-z]{3,}")
+_STOPWORDS = frozenset({
+    "the", "and", "for", "are", "but", "not", "any", "all", "can", "may",
+    "must", "shall", "with", "from", "that", "this", "these", "those",
+    "such", "has", "have", "been", "was", "were", "will", "its", "their",
+    "they", "them", "than", "then", "into", "under", "upon", "within",
+    "after", "before", "each", "other", "which", "who", "what", "when",
+    "where", "only", "also", "including", "does", "per",
+})
+
+# Statute citations as they appear in law sections, lease text and answers
+_CITATION_RE = re.compile(r"""
+    \d{3}\s+ILCS\s+\d+(?:/\d+(?:-\d+)?(?:\.\d+)?)?          # 765 ILCS 705/2, 735 ILCS 5/9-213.1
+  | \d+\s+U\.?S\.?C\.?\s+§?\s*\d+[a-z]?                     # 42 USC 4852d
+  | \d+\s*§\s*\d+[A-Z]?                                     # 186 §15B
+  | (?:RPAPL|RPL|Admin\.?\s+Code)\s+\d+(?:-[0-9a-z]+)?        # RPL 235-b, NYC Admin Code 27-2140
+  | (?:\b(?:Sections?|Secs?\.|Code|RCW|Statutes?|Stats?\.)\s*§*|§+)\s*  # bare sections need a cue:
+    (?P<section>\d{2,4}(?:\.\d{1,4}){1,2}[A-Za-z]?)(?!\.?\d|\s*%)     # § 1950.5, RCW 59.18.280
+""", re.VERBOSE)
+
+@cache
+def _source_hash() -> str:
+    """Hash of this module's source, which holds every statute literal"""
+    return blake2b(Path(__file__).read_bytes(), digest_size=16).hexdigest()
+
+# Canonical state keys and their postal abbreviations
+_STATE_ABBREVIATIONS = {
+    "california": "ca",
+    "new_york": "ny",
+    "texas": "tx",
+    "florida": "fl",
+    "illinois": "il",
+    "washington": "wa",
+    "massachusetts": "ma",
+    "federal": "us",
+}
+
+def _build_state_aliases() -> Dict[str, str]:
+    """Map common spellings ("New York", "new-york", "NY", ...) to canonical keys"""
+    aliases = {}
+    for canon, abbr in _STATE_ABBREVIATIONS.items():
+        spaced = canon.replace("_", " ")
+        for variant in (
+            canon, spaced, spaced.title(), canon.upper(), spaced.upper(),
+            canon.replace("_", "-"), spaced.title().replace(" ", "-"),
+            abbr, abbr.upper(),
+        ):
+            aliases[variant] = canon
+    return aliases
+
+_STATE_ALIASES = _build_state_aliases()
+
+def _normalize_state(state: str) -> str:
+    """Canonical state key, e.g. "New York" -> "new_york" """
+    canon = _STATE_ALIASES.get(state)
+    if canon is None:
+        canon = state.strip().lower().replace(" ", "_").replace("-", "_")
+        canon = _STATE_ALIASES.get(canon, canon)
+    return canon
+
+# BM25 parameters (standard defaults)
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+def _dump_json(obj) -> bytes:
+    """Serialize to indented UTF-8 JSON, via orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+def _load_json(buf) -> object:
+    """Parse JSON from a bytes-like buffer, via orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(buf)
+    return json.loads(bytes(buf))
+
+def _tokenize(text: str) -> List[str]:
+    """Lowercase, drop stopwords and strip plural 's' (deposits -> deposit)"""
+    tokens = []
+    for word in _TOKEN_RE.findall(text.lower()):
+        if word in _STOPWORDS:
+            continue
+        if word.endswith("s") and not word.endswith("ss") and len(word) > 3:
+            word = word[:-1]
+        tokens.append(word)
+    return tokens
+
+def iter_citations(text: str) -> Iterator[str]:
+    """
+    Yield statute citations found in text, in order of appearance.
+    
+    Matches the section formats used in this database (e.g., "1950.5",
+    "765 ILCS 705/2", "186 §15B", "42 USC 4852d"). Bare dotted section
+    numbers only count after a cue such as "§", "Section", "Code" or
+    "RCW", so dollar amounts, percentages and dates are skipped.
+    
+    Args:
+        text: Law text, lease excerpt or generated answer
+        
+    Yields:
+        Each citation string as written (just the number for cued bare
+        sections, e.g. "1950.5" from "Civil Code § 1950.5")
+    """
+    for match in _CITATION_RE.finditer(text):
+        yield match.group("section") or match.group(0)
+
+def make_filter(
+    state: str = None,
+    category: str = None,
+    jurisdiction: str = None
+) -> Callable[[Dict], bool]:
+    """
+    Build a predicate matching laws on state, category and/or jurisdiction.
+    
+    Only the requested fields are checked, via a single itemgetter call
+    compared against the target values.
+    
+    Args:
+        state: Exact state key (e.g., "new_york", "federal")
+        category: Law category (e.g., "eviction")
+        jurisdiction: "state" or "federal"
+        
+    Returns:
+        Function taking a law dict and returning True if it matches
+    """
+    wanted = {
+        field: value
+        for field, value in (
+            ("state", state),
+            ("category", category),
+            ("jurisdiction", jurisdiction),
+        )
+        if value is not None
+    }
+    
+    if not wanted:
+        return lambda law: True
+    
+    get = itemgetter(*wanted)
+    target = tuple(wanted.values()) if len(wanted) > 1 else next(iter(wanted.values()))
+    
+    return lambda law: get(law) == target
+
+class ChainSeq(SequenceABC):
+    """Read-only concatenation of two sequences that doesn't copy either"""
+    
+    __slots__ = ("_head", "_tail")
+    
+    def __init__(self, head: Sequence, tail: Sequence):
+        self._head = head
+        self._tail = tail
+    
+    def __len__(self) -> int:
+        return len(self._head) + len(self._tail)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self)[index]
+        n = len(self._head)
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("ChainSeq index out of range")
+        return self._head[index] if index < n else self._tail[index - n]
+    
+    def __iter__(self) -> Iterator:
+        return chain(self._head, self._tail)
+    
+    def __repr__(self) -> str:
+        return f"ChainSeq({self._head!r}, {self._tail!r})"
+
+@dataclass
+class LawBundle:
+    """Column-oriented view of one state's laws (parallel lists, same order)"""
+    
+    state: str
+    jurisdiction: str
+    sections: List[str]
+    titles: List[str]
+    texts: List[str]
+    categories: np.ndarray  # uint8 category ids, one byte per law
+    category_names: Tuple[str, ...]
+    
+    @classmethod
+    def from_laws(
+        cls,
+        laws: Sequence[Dict],
+        category_ids: Dict[str, int],
+        category_names: Tuple[str, ...]
+    ) -> "LawBundle":
+        """Split law dicts sharing one state/jurisdiction into columns"""
+        return cls(
+            state=laws[0]["state"],
+            jurisdiction=laws[0]["jurisdiction"],
+            sections=[law["section"] for law in laws],
+            titles=[law["title"] for law in laws],
+            texts=[law["text"] for law in laws],
+            categories=np.array(
+                [category_ids[law["category"]] for law in laws], dtype=np.uint8
+            ),
+            category_names=category_names,
+        )
+    
+    def __len__(self) -> int:
+        return len(self.texts)
+    
+    def category_set(self) -> frozenset:
+        """Distinct categories in this bundle, from the id column alone"""
+        return frozenset(self.category_names[code] for code in np.unique(self.categories))
+    
+    def where(self, category: str) -> np.ndarray:
+        """Row positions of laws in the given category"""
+        if category not in self.category_names:
+            return np.zeros(0, dtype=np.intp)
+        return np.flatnonzero(self.categories == self.category_names.index(category))
+    
+    def to_dicts(self) -> List[Dict]:
+        """Rebuild the row-oriented law dicts"""
+        return [
+            {
+                "section": section,
+                "title": title,
+                "text": text,
+                "category": self.category_names[code],
+                "state": self.state,
+                "jurisdiction": self.jurisdiction,
+            }
+            for section, title, text, code in zip(
+                self.sections, self.titles, self.texts, self.categories
+            )
+        ]
+
 class StateLawDatabase:
     """Manages tenant protection laws for multiple states + federal"""
     
@@ -17,13 +270,55 @@ class StateLawDatabase:
         "massachusetts"
     ]
     
+    # Fixed attribute set (federal_laws is a property over _federal)
+    __slots__ = (
+        "laws_by_state", "_federal", "source_hash", "_combined_cache", "_total_state_sections",
+        "category_names", "category_ids", "bundles",
+        "_all_laws", "_by_state", "_by_category", "_by_state_category",
+        "_section_index", "_inverted", "_postings", "_term_freqs", "_idf",
+        "_len_norm",
+    )
+    
     def __init__(self):
         self.laws_by_state = {}
-        self.federal_laws = []
+        self._federal = None  # set only when loaded from JSON
+        self.source_hash = None  # law source the JSON was saved from
+        self._combined_cache = {}
+        self._total_state_sections = 0
+        
+        # Category dictionary encoding (id <-> name), built with the indexes
+        self.category_names = ()
+        self.category_ids = {}
+        self.bundles = {}
+        
+        # Lookup indexes (built by build_all_laws)
+        self._all_laws = ()
+        self._by_state = {}
+        self._by_category = {}
+        self._by_state_category = {}
+        self._section_index = {}
+        self._inverted = {}
+        self._postings = {}
+        self._term_freqs = {}
+        self._idf = {}
+        self._len_norm = np.zeros(0, dtype=np.float32)
     
-    def get_california_laws(self) -> List[Dict]:
+    @property
+    def federal_laws(self) -> Tuple[Dict, ...]:
+        """Federal laws: the shared cached tuple unless loaded from JSON"""
+        if self._federal is not None:
+            return self._federal
+        return self.get_federal_laws()
+    
+    @federal_laws.setter
+    def federal_laws(self, laws: Sequence[Dict]):
+        self._federal = tuple(laws)
+    
+    @staticmethod
+    @cache
+    def get_california_laws() -> Tuple[Dict, ...]:
         """California Civil Code 1940-1954"""
-        return [
+        return (
             {
                 "section": "1940",
                 "title": "Definitions - Hiring of Real Property",
@@ -120,11 +415,13 @@ class StateLawDatabase:
                 "state": "california",
                 "jurisdiction": "state"
             }
-        ]
+        )
     
-    def get_new_york_laws(self) -> List[Dict]:
+    @staticmethod
+    @cache
+    def get_new_york_laws() -> Tuple[Dict, ...]:
         """New York Real Property Law & Rent Stabilization Code"""
-        return [
+        return (
             {
                 "section": "RPL 235-b",
                 "title": "Security Deposits - Requirements and Limits",
@@ -205,11 +502,13 @@ class StateLawDatabase:
                 "state": "new_york",
                 "jurisdiction": "state"
             }
-        ]
+        )
     
-    def get_texas_laws(self) -> List[Dict]:
+    @staticmethod
+    @cache
+    def get_texas_laws() -> Tuple[Dict, ...]:
         """Texas Property Code Chapter 92"""
-        return [
+        return (
             {
                 "section": "92.102",
                 "title": "Security Deposit Refund Requirements",
@@ -290,11 +589,13 @@ class StateLawDatabase:
                 "state": "texas",
                 "jurisdiction": "state"
             }
-        ]
+        )
     
-    def get_florida_laws(self) -> List[Dict]:
+    @staticmethod
+    @cache
+    def get_florida_laws() -> Tuple[Dict, ...]:
         """Florida Statutes Chapter 83 Part II"""
-        return [
+        return (
             {
                 "section": "83.49",
                 "title": "Security Deposits - Holding and Return",
@@ -375,11 +676,13 @@ class StateLawDatabase:
                 "state": "florida",
                 "jurisdiction": "state"
             }
-        ]
+        )
     
-    def get_illinois_laws(self) -> List[Dict]:
+    @staticmethod
+    @cache
+    def get_illinois_laws() -> Tuple[Dict, ...]:
         """Illinois Compiled Statutes 765 ILCS 705 & 710"""
-        return [
+        return (
             {
                 "section": "765 ILCS 710/1",
                 "title": "Security Deposit Return Act - Requirements",
@@ -460,11 +763,13 @@ class StateLawDatabase:
                 "state": "illinois",
                 "jurisdiction": "state"
             }
-        ]
+        )
     
-    def get_washington_laws(self) -> List[Dict]:
+    @staticmethod
+    @cache
+    def get_washington_laws() -> Tuple[Dict, ...]:
         """Washington Revised Code (RCW) 59.18"""
-        return [
+        return (
             {
                 "section": "59.18.270",
                 "title": "Security Deposit - Return and Deductions",
@@ -545,11 +850,13 @@ class StateLawDatabase:
                 "state": "washington",
                 "jurisdiction": "state"
             }
-        ]
+        )
     
-    def get_massachusetts_laws(self) -> List[Dict]:
+    @staticmethod
+    @cache
+    def get_massachusetts_laws() -> Tuple[Dict, ...]:
         """Massachusetts General Laws Chapter 186"""
-        return [
+        return (
             {
                 "section": "186 §15B",
                 "title": "Security Deposit Requirements",
@@ -630,11 +937,13 @@ class StateLawDatabase:
                 "state": "massachusetts",
                 "jurisdiction": "state"
             }
-        ]
+        )
     
-    def get_federal_laws(self) -> List[Dict]:
+    @staticmethod
+    @cache
+    def get_federal_laws() -> Tuple[Dict, ...]:
         """Federal tenant protection laws"""
-        return [
+        return (
             {
                 "section": "Fair Housing Act Title VIII",
                 "title": "Prohibition of Housing Discrimination",
@@ -699,54 +1008,451 @@ class StateLawDatabase:
                 "state": "federal",
                 "jurisdiction": "federal"
             }
-        ]
+        )
     
-    def build_all_laws(self) -> Dict[str, List[Dict]]:
+    # State key -> law loader method name, in SUPPORTED_STATES order. Names
+    # are resolved with getattr: raw staticmethod objects in a class-body
+    # dict are not callable before Python 3.10.
+    _STATE_LOADERS = {
+        "california": "get_california_laws",
+        "new_york": "get_new_york_laws",
+        "texas": "get_texas_laws",
+        "florida": "get_florida_laws",
+        "illinois": "get_illinois_laws",
+        "washington": "get_washington_laws",
+        "massachusetts": "get_massachusetts_laws",
+    }
+    
+    def build_all_laws(self) -> Dict[str, Tuple[Dict, ...]]:
         """Build complete multi-state database"""
         
         self.laws_by_state = {
-            "california": self.get_california_laws(),
-            "new_york": self.get_new_york_laws(),
-            "texas": self.get_texas_laws(),
-            "florida": self.get_florida_laws(),
-            "illinois": self.get_illinois_laws(),
-            "washington": self.get_washington_laws(),
-            "massachusetts": self.get_massachusetts_laws(),
+            state: getattr(self, loader)() for state, loader in self._STATE_LOADERS.items()
         }
         
-        self.federal_laws = self.get_federal_laws()
+        self._federal = None
+        
+        self._build_indexes()
         
         return self.laws_by_state
     
-    def get_laws_for_state(self, state: str) -> List[Dict]:
+    @classmethod
+    def from_json(cls, path: str = "data/laws/all_laws_database.json") -> "StateLawDatabase":
         """
-        Get laws for specific state + federal laws.
+        Load a database previously written by save_to_json.
+        
+        Skips rebuilding every law from the Python literals. The file is
+        memory-mapped and parsed in place rather than read into a copy.
         
         Args:
-            state: State name (e.g., "california", "new york")
+            path: Path to all_laws_database.json
+            
+        Returns:
+            Database with all states, federal laws and indexes loaded
+        """
+        with open(path, "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                memoryview(mm) as buf:
+            data = _load_json(buf)
+        
+        db = cls()
+        db.laws_by_state = {state: tuple(laws) for state, laws in data["states"].items()}
+        db.federal_laws = tuple(data["federal"])
+        db.source_hash = data.get("source_hash")
+        db._build_indexes()
+        
+        return db
+    
+    @classmethod
+    def load(cls, path: str = "data/laws/all_laws_database.json") -> "StateLawDatabase":
+        """
+        Get a ready database, preferring the prebuilt JSON artifact.
+        
+        The artifact records a hash of this module's source when saved, so
+        one written before a statute edit is ignored rather than served.
+        
+        Args:
+            path: Path to all_laws_database.json written by save_to_json
+            
+        Returns:
+            Database loaded via from_json if the file exists and matches
+            the current source, otherwise built from the Python literals
+        """
+        if Path(path).is_file():
+            db = cls.from_json(path)
+            if db.source_hash == _source_hash():
+                return db
+            print(f"⚠️  {path} is out of date with the law source, rebuilding")
+        
+        db = cls()
+        db.build_all_laws()
+        return db
+    
+    def _build_indexes(self):
+        """Index all laws (state + federal) by state, category and both in one pass"""
+        
+        self._all_laws = tuple(
+            law
+            for laws in (*self.laws_by_state.values(), self.federal_laws)
+            for law in laws
+        )
+        self._total_state_sections = len(self._all_laws) - len(self.federal_laws)
+        
+        # Share one string object per value across records (JSON loads
+        # otherwise allocate a fresh copy for every law)
+        for law in self._all_laws:
+            for field in ("category", "state", "jurisdiction"):
+                law[field] = sys.intern(law[field])
+        
+        self._by_state = {}
+        self._by_category = {}
+        self._by_state_category = {}
+        
+        for law in self._all_laws:
+            state, category = law["state"], law["category"]
+            self._by_state.setdefault(state, []).append(law)
+            self._by_category.setdefault(category, []).append(law)
+            self._by_state_category.setdefault((state, category), []).append(law)
+        
+        # Freeze buckets so get_laws() can hand them out without copying
+        for index in (self._by_state, self._by_category, self._by_state_category):
+            for key, laws in index.items():
+                index[key] = tuple(laws)
+        
+        self.category_names = tuple(sorted(self._by_category))
+        self.category_ids = {name: i for i, name in enumerate(self.category_names)}
+        
+        # Columnar copy per state (federal included) for scans and bulk embedding
+        self.bundles = {
+            state: LawBundle.from_laws(laws, self.category_ids, self.category_names)
+            for state, laws in self._by_state.items()
+        }
+        
+        # Per-state (sorted sections, laws) pairs for binary-search citation lookup
+        self._section_index = {}
+        for state, laws in self._by_state.items():
+            ordered = sorted(laws, key=lambda law: law["section"])
+            self._section_index[state] = ([law["section"] for law in ordered], ordered)
+        
+        # Combined state + federal views served by get_laws_for_state()
+        self._combined_cache = {
+            state: ChainSeq(laws, self.federal_laws)
+            for state, laws in self.laws_by_state.items()
+        }
+        
+        # Text index is built on the first search()/rank() call
+        self._inverted = {}
+    
+    def _build_search_index(self):
+        """Tokenize every law and precompute the inverted index and BM25 statistics"""
+        
+        # Inverted index: term -> sorted positions in self._all_laws,
+        # with matching term frequencies for BM25
+        laws = self._all_laws
+        inverted = {}
+        term_freqs = {}
+        doc_len = np.zeros(len(laws), dtype=np.int32)
+        
+        for i, law in enumerate(laws):
+            tokens = _tokenize(law["text"])
+            doc_len[i] = len(tokens)
+            for term, count in Counter(tokens).items():
+                inverted.setdefault(term, []).append(i)
+                term_freqs.setdefault(term, []).append(count)
+        
+        # Precompute BM25 statistics once so ranking is pure array math
+        n_docs = len(laws)
+        avgdl = doc_len.mean() if n_docs else 0.0
+        self._postings = {
+            term: np.array(docs, dtype=np.int32)
+            for term, docs in inverted.items()
+        }
+        self._term_freqs = {
+            term: np.array(freqs, dtype=np.float32)
+            for term, freqs in term_freqs.items()
+        }
+        self._idf = {
+            term: float(np.log((n_docs - len(docs) + 0.5) / (len(docs) + 0.5) + 1))
+            for term, docs in inverted.items()
+        }
+        self._len_norm = (
+            BM25_K1 * (1 - BM25_B + BM25_B * doc_len / avgdl)
+        ).astype(np.float32) if n_docs else np.zeros(0, dtype=np.float32)
+        
+        # Publish last: search()/rank() treat a non-empty _inverted as a
+        # finished index, so threads sharing this database (see
+        # get_law_database) never see a partial one
+        self._inverted = inverted
+    
+    def all_laws(self) -> Tuple[Dict, ...]:
+        """
+        Get every law (all states, then federal) as one prebuilt tuple.
+        
+        Returns:
+            The shared combined tuple; no per-call concatenation
+        """
+        if not self._all_laws:
+            self.build_all_laws()
+        
+        return self._all_laws
+    
+    def get_laws(self, state: str = None, category: str = None) -> Tuple[Dict, ...]:
+        """
+        Get laws filtered by state and/or category using prebuilt indexes.
+        
+        Args:
+            state: State name (e.g., "california", "new york") or "federal"
+            category: Law category (e.g., "security_deposit")
+            
+        Returns:
+            Matching laws (all laws if no filter is given)
+        """
+        
+        # Build database if not already built
+        if not self._all_laws:
+            self.build_all_laws()
+        
+        if state is not None:
+            state = _normalize_state(state)
+        
+        if state is not None and category is not None:
+            return self._by_state_category.get((state, category), ())
+        if state is not None:
+            return self._by_state.get(state, ())
+        if category is not None:
+            return self._by_category.get(category, ())
+        
+        return self.all_laws()
+    
+    def laws_by_category(self, state: str, category: str) -> Sequence[Dict]:
+        """
+        Get a state's laws in one category, followed by federal laws in it.
+        
+        Both halves come straight from the (state, category) index, so
+        topical lookups never scan the corpus.
+        
+        Args:
+            state: State name (e.g., "california", "new york") or "federal"
+            category: Law category (e.g., "security_deposit")
             
         Returns:
-            Combined list of state laws + federal laws
+            Read-only sequence of matching state laws then federal laws
+            (just the federal laws when state is "federal")
+            
+        Raises:
+            ValueError: If the state is not supported
         """
+        state = _normalize_state(state)
+        federal = self.get_laws(state="federal", category=category)
         
-        state = state.lower().replace(" ", "_")
+        if state == "federal":
+            return federal
+        
+        if state not in self.SUPPORTED_STATES:
+            raise ValueError(
+                f"State '{state}' not yet supported. "
+                f"Supported states: {', '.join(self.SUPPORTED_STATES)}"
+            )
+        
+        return ChainSeq(self.get_laws(state=state, category=category), federal)
+    
+    def filter_laws(
+        self,
+        laws: Sequence[Dict] = None,
+        *,
+        state: str = None,
+        category: str = None,
+        jurisdiction: str = None
+    ) -> List[Dict]:
+        """
+        Filter a list of laws (default: all laws) with a compiled predicate.
+        
+        Args:
+            laws: Laws to filter, e.g. the result of get_laws_for_state()
+            state: Exact state key (e.g., "new_york", "federal")
+            category: Law category (e.g., "eviction")
+            jurisdiction: "state" or "federal"
+            
+        Returns:
+            Laws matching every given field
+        """
+        if laws is None:
+            laws = self.get_laws()
+        
+        return list(filter(make_filter(state, category, jurisdiction), laws))
+    
+    def iter_laws(self, *, state: str = None, category: str = None) -> Iterator[Dict]:
+        """
+        Lazily iterate laws filtered by state and/or category.
+        
+        Walks the prebuilt index bucket without copying it, so callers that
+        stop early or filter further never materialize a new list.
+        
+        Args:
+            state: State name (e.g., "california") or "federal"
+            category: Law category (e.g., "eviction")
+            
+        Yields:
+            Matching laws
+        """
+        yield from self.get_laws(state=state, category=category)
+    
+    def get_section(self, state: str, section: str) -> Optional[Dict]:
+        """
+        Look up a single law by its statute section.
+        
+        Args:
+            state: State name (e.g., "florida") or "federal"
+            section: Section citation (e.g., "83.56")
+            
+        Returns:
+            Matching law, or None if the state has no such section
+        """
         
         # Build database if not already built
-        if not self.laws_by_state:
+        if not self._all_laws:
             self.build_all_laws()
         
-        if state not in self.laws_by_state:
+        state = _normalize_state(state)
+        if state not in self._section_index:
+            return None
+        
+        sections, laws = self._section_index[state]
+        i = bisect_left(sections, section)
+        if i < len(sections) and sections[i] == section:
+            return laws[i]
+        return None
+    
+    def search(self, terms: Union[str, List[str]]) -> List[Dict]:
+        """
+        Keyword search over law text using the inverted index.
+        
+        Args:
+            terms: A keyword or phrase, or a list of them; every term must
+                appear in a law
+            
+        Returns:
+            Laws containing all terms, in database order
+        """
+        
+        # A bare string is one phrase, not a sequence of characters
+        if isinstance(terms, str):
+            terms = [terms]
+        
+        # Build database and text index if not already built
+        if not self._all_laws:
+            self.build_all_laws()
+        if not self._inverted:
+            self._build_search_index()
+        
+        stems = {stem for term in terms for stem in _tokenize(term)}
+        if not stems:
+            return []
+        
+        postings = []
+        for stem in stems:
+            if stem not in self._inverted:
+                return []
+            postings.append(self._inverted[stem])
+        
+        # Intersect shortest postings first
+        postings.sort(key=len)
+        hits = set(postings[0]).intersection(*postings[1:])
+        
+        return [self._all_laws[i] for i in sorted(hits)]
+    
+    def rank(self, query: str, k: int = 5) -> List[Dict]:
+        """
+        Rank laws against a free-text query with BM25.
+        
+        Args:
+            query: Search query (e.g., "late fee limit")
+            k: Number of results
+            
+        Returns:
+            Up to k laws with a non-zero score, best match first
+        """
+        
+        # Build database and text index if not already built
+        if not self._all_laws:
+            self.build_all_laws()
+        if not self._inverted:
+            self._build_search_index()
+        
+        scores = np.zeros(len(self._all_laws), dtype=np.float32)
+        
+        for term in set(_tokenize(query)):
+            docs = self._postings.get(term)
+            if docs is None:
+                continue
+            tf = self._term_freqs[term]
+            scores[docs] += self._idf[term] * tf * (BM25_K1 + 1) / (tf + self._len_norm[docs])
+        
+        hits = np.flatnonzero(scores)
+        if len(hits) > k:
+            hits = hits[np.argpartition(-scores[hits], k - 1)[:k]]
+        hits = hits[np.argsort(-scores[hits], kind="stable")]
+        
+        return [self._all_laws[i] for i in hits]
+    
+    def get_laws_for_state(self, state: str) -> Sequence[Dict]:
+        """
+        Get laws for specific state + federal laws.
+        
+        Args:
+            state: State name (e.g., "california", "new york")
+            
+        Returns:
+            Read-only sequence of state laws followed by federal laws
+        """
+        
+        state = _normalize_state(state)
+        
+        if state not in self.SUPPORTED_STATES:
             raise ValueError(
                 f"State '{state}' not yet supported. "
                 f"Supported states: {', '.join(self.SUPPORTED_STATES)}"
             )
         
-        # Combine state laws + federal laws
-        state_laws = self.laws_by_state.get(state, [])
-        combined = state_laws + self.federal_laws
+        cached = self._combined_cache.get(state)
+        if cached is not None:
+            return cached
+        
+        # Load only the requested state (plus federal) instead of every state
+        if state not in self.laws_by_state:
+            self.laws_by_state[state] = getattr(self, self._STATE_LOADERS[state])()
+            self._total_state_sections += len(self.laws_by_state[state])
+        
+        # Chain state laws + federal laws once per state (no copy)
+        state_laws = self.laws_by_state.get(state, ())
+        combined = ChainSeq(state_laws, self.federal_laws)
+        self._combined_cache[state] = combined
         
         return combined
     
+    def _write_combined_json(self, path: str):
+        """
+        Stream all_laws_database.json one state at a time.
+        
+        Produces the same indented document as dumping the combined dict,
+        without holding the whole encoded database in memory at once.
+        
+        Args:
+            path: Output file path
+        """
+        def nested(obj, depth: int) -> bytes:
+            return _dump_json(obj).replace(b"\n", b"\n" + b"  " * depth)
+        
+        with open(path, "wb") as f:
+            f.write(b'{\n  "states": {')
+            for i, (state, laws) in enumerate(self.laws_by_state.items()):
+                f.write(b",\n    " if i else b"\n    ")
+                f.write(_dump_json(state) + b": " + nested(laws, 2))
+            f.write(b'\n  },\n  "federal": ' + nested(self.federal_laws, 1))
+            f.write(b',\n  "supported_states": ' + nested(self.SUPPORTED_STATES, 1))
+            f.write(b',\n  "source_hash": ' + _dump_json(_source_hash()))
+            f.write(b"\n}")
+    
     def save_to_json(self, output_dir: str = "data/laws"):
         """Save all laws to JSON files"""
         
@@ -755,45 +1461,58 @@ class StateLawDatabase:
         # Build all laws
         self.build_all_laws()
         
-        # Save each state separately
-        for state, laws in self.laws_by_state.items():
-            filepath = f"{output_dir}/{state}_laws.json"
-            with open(filepath, "w") as f:
-                json.dump(laws, f, indent=2)
-            print(f"✓ Saved {len(laws)} laws for {state}")
-        
-        # Save federal laws
-        filepath = f"{output_dir}/federal_laws.json"
-        with open(filepath, "w") as f:
-            json.dump(self.federal_laws, f, indent=2)
-        print(f"✓ Saved {len(self.federal_laws)} federal laws")
-        
-        # Save combined database
-        all_laws = {
-            "states": self.laws_by_state,
-            "federal": self.federal_laws,
-            "supported_states": self.SUPPORTED_STATES
-        }
+        # Collect progress output and write it in one go at the end
+        log_lines = []
         
-        filepath = f"{output_dir}/all_laws_database.json"
-        with open(filepath, "w") as f:
-            json.dump(all_laws, f, indent=2)
-        print(f"✓ Saved complete multi-state database")
+        # Serialize the per-state and federal files up front
+        outputs = [
+            (f"{output_dir}/{state}_laws.json", _dump_json(laws))
+            for state, laws in self.laws_by_state.items()
+        ]
+        outputs.append((f"{output_dir}/federal_laws.json", _dump_json(self.federal_laws)))
         
-        # Print summary
-        print(f"\n{'='*60}")
-        print("MULTI-STATE LAW DATABASE SUMMARY")
-        print(f"{'='*60}")
-        print(f"Total states: {len(self.laws_by_state)}")
-        print(f"Federal laws: {len(self.federal_laws)}")
+        # Write concurrently (file writes release the GIL); the combined
+        # database is streamed one section at a time alongside them
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            combined = executor.submit(
+                self._write_combined_json, f"{output_dir}/all_laws_database.json"
+            )
+            list(executor.map(lambda output: Path(output[0]).write_bytes(output[1]), outputs))
+            combined.result()
         
-        total_sections = sum(len(laws) for laws in self.laws_by_state.values())
-        print(f"Total state law sections: {total_sections}")
-        print(f"Grand total: {total_sections + len(self.federal_laws)} sections")
+        for state, laws in self.laws_by_state.items():
+            log_lines.append(f"✓ Saved {len(laws)} laws for {state}")
+        log_lines.append(f"✓ Saved {len(self.federal_laws)} federal laws")
+        log_lines.append(f"✓ Saved complete multi-state database")
+        
+        # Summary
+        log_lines.append(f"\n{'='*60}")
+        log_lines.append("MULTI-STATE LAW DATABASE SUMMARY")
+        log_lines.append(f"{'='*60}")
+        log_lines.append(f"Total states: {len(self.laws_by_state)}")
+        log_lines.append(f"Federal laws: {len(self.federal_laws)}")
+        
+        total_sections = self._total_state_sections
+        log_lines.append(f"Total state law sections: {total_sections}")
+        log_lines.append(f"Grand total: {total_sections + len(self.federal_laws)} sections")
         
-        print(f"\nState breakdown:")
+        log_lines.append(f"\nState breakdown:")
         for state, laws in sorted(self.laws_by_state.items()):
-            print(f"  {state.title()}: {len(laws)} sections")
+            log_lines.append(f"  {state.title()}: {len(laws)} sections")
+        
+        sys.stdout.write("\n".join(log_lines) + "\n")
+        sys.stdout.flush()
+
+@cache
+def get_law_database(path: str = "data/laws/all_laws_database.json") -> StateLawDatabase:
+    """
+    Shared, fully indexed database per JSON path (see StateLawDatabase.load).
+    
+    Callers that only read laws reuse one instance instead of re-parsing
+    the JSON and rebuilding the indexes each time. Build a fresh
+    StateLawDatabase to mutate one.
+    """
+    return StateLawDatabase.load(path)
 
 # Build database
 if __name__ == "__main__":
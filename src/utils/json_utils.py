@@ -0,0 +1,41 @@
+"""
+JSON helpers for LLM responses
+
+The grader and classifier prompts ask the model for a bare JSON object;
+this parses that reply (tolerating ``` fences) with orjson when installed.
+"""
+
+import json
+import re
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# ```json ... ``` or ``` ... ``` wrapped around the whole reply
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*(.*?)\s*```\s*$", re.DOTALL)
+
+def parse_llm_json(content):
+    """
+    Parse a JSON reply from an LLM.
+
+    Args:
+        content: Message content (str or bytes), optionally fenced in ```
+
+    Returns:
+        Parsed JSON value
+
+    Raises:
+        json.JSONDecodeError: If the content is not valid JSON
+        (orjson.JSONDecodeError subclasses it)
+    """
+    if isinstance(content, str):
+        match = _FENCE_RE.match(content)
+        if match:
+            content = match.group(1)
+
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
@@ -0,0 +1,25 @@
+"""
+Shared chat model clients
+
+Agents and chains ask for a model by name and temperature instead of
+constructing ChatOpenAI themselves, so every node in every run reuses the
+same client (and its HTTP connection pool).
+"""
+
+from functools import lru_cache
+
+from langchain_openai import ChatOpenAI
+
+@lru_cache(maxsize=None)
+def get_chat_model(model: str, temperature: float = 0) -> ChatOpenAI:
+    """
+    Process-wide ChatOpenAI client for one (model, temperature).
+
+    Args:
+        model: OpenAI model name, e.g. config["models"]["fast_model"]
+        temperature: Sampling temperature
+
+    Returns:
+        Shared ChatOpenAI instance
+    """
+    return ChatOpenAI(model=model, temperature=temperature)
@@ -420,6 +420,20 @@ You are analyzing whether a lease complies with state/federal tenant protection
 """
 
 
+# ========== COMPILED TEMPLATES ==========
+# Parsed once at import so agents don't rebuild a template per request
+
+LEASE_ANALYZER_PROMPT_TMPL = ChatPromptTemplate.from_template(LEASE_ANALYZER_PROMPT)
+LAW_ANALYZER_PROMPT_TMPL = ChatPromptTemplate.from_template(LAW_ANALYZER_PROMPT)
+RETRIEVAL_GRADER_PROMPT_TMPL = ChatPromptTemplate.from_template(RETRIEVAL_GRADER_PROMPT)
+SYNTHESIS_PROMPT_TMPL = ChatPromptTemplate.from_template(SYNTHESIS_PROMPT)
+QUERY_REFINEMENT_PROMPT_TMPL = ChatPromptTemplate.from_template(QUERY_REFINEMENT_PROMPT)
+CLASSIFIER_PROMPT_TMPL = ChatPromptTemplate.from_template(CLASSIFIER_PROMPT)
+SYNTHESIS_LEASE_ONLY_PROMPT_TMPL = ChatPromptTemplate.from_template(SYNTHESIS_LEASE_ONLY_PROMPT)
+SYNTHESIS_LAW_ONLY_PROMPT_TMPL = ChatPromptTemplate.from_template(SYNTHESIS_LAW_ONLY_PROMPT)
+SYNTHESIS_COMPARISON_PROMPT_TMPL = ChatPromptTemplate.from_template(SYNTHESIS_COMPARISON_PROMPT)
+
+
 # For easy imports
 __all__ = [
     "LEASE_ANALYZER_PROMPT",
@@ -430,5 +444,14 @@ __all__ = [
     "CLASSIFIER_PROMPT",
     "SYNTHESIS_LEASE_ONLY_PROMPT",
     "SYNTHESIS_LAW_ONLY_PROMPT",
-    "SYNTHESIS_COMPARISON_PROMPT"
+    "SYNTHESIS_COMPARISON_PROMPT",
+    "LEASE_ANALYZER_PROMPT_TMPL",
+    "LAW_ANALYZER_PROMPT_TMPL",
+    "RETRIEVAL_GRADER_PROMPT_TMPL",
+    "SYNTHESIS_PROMPT_TMPL",
+    "QUERY_REFINEMENT_PROMPT_TMPL",
+    "CLASSIFIER_PROMPT_TMPL",
+    "SYNTHESIS_LEASE_ONLY_PROMPT_TMPL",
+    "SYNTHESIS_LAW_ONLY_PROMPT_TMPL",
+    "SYNTHESIS_COMPARISON_PROMPT_TMPL"
 ]
\ No newline at end of file
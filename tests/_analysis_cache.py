@@ -0,0 +1,139 @@
+"""
+Shared run_analysis cache for integration tests and benchmarks
+
+The same questions are asked by several test files; each unique
+(query, collection, state) runs the full pipeline once per process and
+later callers get a copy of the stored result.
+
+Set LEASELOGIC_SEMANTIC_CACHE=1 to also reuse results for near-duplicate
+phrasings (see _semantic_cache.py); off by default since a close match
+can differ in query scope.
+
+record_results()/replay_results() save the cache to JSON and load it back,
+so reports can be regenerated without running the pipeline.
+"""
+
+import copy
+import json
+import os
+
+from src.agents.supervisor import run_analysis, run_analysis_batch
+from tests._semantic_cache import ProximityCache
+
+SEMANTIC_CACHE = os.getenv("LEASELOGIC_SEMANTIC_CACHE") == "1"
+
+_results = {}
+_semantic = {}
+_replaying = False
+
+def record_results(path: str):
+    """Write every cached result to a JSON file (non-JSON values become strings)"""
+    entries = [
+        {"query": query, "collection": collection, "state": state, "result": result}
+        for (query, collection, state), result in _results.items()
+    ]
+    with open(path, "w") as f:
+        json.dump(entries, f, indent=2, default=str)
+    print(f"Recorded {len(entries)} results to {path}")
+
+def replay_results(path: str):
+    """
+    Serve results from a record_results() file instead of running the pipeline.
+    
+    Queries missing from the file raise KeyError rather than calling the LLM.
+    """
+    global _replaying
+    with open(path) as f:
+        for entry in json.load(f):
+            _results[(entry["query"], entry["collection"], entry["state"])] = entry["result"]
+    _replaying = True
+    print(f"Replaying {len(_results)} results from {path}")
+
+def _semantic_cache(lease_collection_name: str, state_location: str) -> ProximityCache:
+    """Proximity cache for one (collection, state), created on first use"""
+    key = (lease_collection_name, state_location)
+    if key not in _semantic:
+        from src.tools.embeddings import get_vector_store_manager
+        _semantic[key] = ProximityCache(get_vector_store_manager().embed_query)
+    return _semantic[key]
+
+def cached_run_analysis(
+    user_query: str,
+    lease_collection_name: str,
+    state_location: str = "california",
+    refresh: bool = False
+) -> dict:
+    """
+    run_analysis() memoized by (query, collection, state).
+
+    Args:
+        user_query: User's question about their lease
+        lease_collection_name: Name of ChromaDB collection for user's lease
+        state_location: State for law lookup
+        refresh: Always run the pipeline (e.g. when timing it) and store
+            the fresh result for later callers
+
+    Returns:
+        Deep copy of the final state, so tests can't affect each other
+    """
+    key = (user_query, lease_collection_name, state_location)
+
+    if _replaying:
+        return copy.deepcopy(_results[key])
+
+    if refresh or key not in _results:
+        compute = lambda: run_analysis(
+            user_query=user_query,
+            lease_collection_name=lease_collection_name,
+            state_location=state_location
+        )
+        if SEMANTIC_CACHE and not refresh:
+            cache = _semantic_cache(lease_collection_name, state_location)
+            _results[key] = cache.get_or_compute(user_query, compute)
+        else:
+            _results[key] = compute()
+
+    return copy.deepcopy(_results[key])
+
+def cached_run_analysis_batch(
+    user_queries: list,
+    lease_collection_name: str,
+    state_location: str = "california"
+) -> list:
+    """
+    Batched cached_run_analysis(): only uncached queries are run, in one batch.
+
+    Args:
+        user_queries: Questions about the lease
+        lease_collection_name: Name of ChromaDB collection for user's lease
+        state_location: State for law lookup
+
+    Returns:
+        Deep copies of the final states, in the same order as user_queries
+    """
+    keys = [(query, lease_collection_name, state_location) for query in user_queries]
+    if _replaying:
+        return [copy.deepcopy(_results[key]) for key in keys]
+
+    missing = list(dict.fromkeys(key[0] for key in keys if key not in _results))
+
+    vectors = {}
+    if SEMANTIC_CACHE and missing:
+        cache = _semantic_cache(lease_collection_name, state_location)
+        pending = []
+        for query in missing:
+            vectors[query], value = cache.lookup(query)
+            if value is None:
+                pending.append(query)
+            else:
+                _results[(query, lease_collection_name, state_location)] = value
+        missing = pending
+
+    if missing:
+        results = run_analysis_batch(missing, lease_collection_name, state_location)
+        for query, result in zip(missing, results):
+            _results[(query, lease_collection_name, state_location)] = result
+            if query in vectors:
+                cache.insert(vectors[query], result)
+
+    return [copy.deepcopy(_results[key]) for key in keys]
@@ -0,0 +1,29 @@
+"""
+Prebuilt vector store prerequisites for quick tests
+
+Quick tests only read collections that the slow tests build
+(test_phase1.py for the sample lease, test_phase2.py for state laws).
+Searching a missing collection would create it empty, so tests check
+first and skip instead.
+"""
+
+import pytest
+
+from src.tools.embeddings import get_vector_store_manager
+
+LEASE_COLLECTION = "test_lease_phase1"
+
+def require_collections(*names: str):
+    """
+    Skip the calling test unless every named collection exists.
+
+    Args:
+        names: Chroma collection names, e.g. "test_lease_phase1", "texas_laws"
+    """
+    vsm = get_vector_store_manager()
+    missing = [name for name in names if not vsm.collection_exists(name)]
+    if missing:
+        pytest.skip(
+            f"Missing collection(s): {', '.join(missing)}. Build them first with "
+            "python -m pytest tests/test_phase1.py tests/test_phase2.py -m slow"
+        )
@@ -0,0 +1,29 @@
+"""
+Canonical test and benchmark queries
+
+Every file asks its questions through this table, so the same question is
+worded identically everywhere and the shared run_analysis cache (see
+_analysis_cache.py) runs it once per session.
+"""
+
+# name -> (query, expected scope)
+SHARED = {
+    "monthly_rent": ("What is my monthly rent?", "lease_only"),
+    "pets": ("Can I have pets?", "lease_only"),
+    "deposit_law": ("What does California law say about security deposits?", "law_only"),
+    "max_deposit": ("What is the maximum security deposit?", "law_only"),
+    "late_fee_300": ("Is my $300 late fee legal?", "both"),
+    "entry_notice": ("How much notice for landlord entry?", "both"),
+}
+
+# Routing checks: one question per scope
+CLASSIFICATION = [SHARED[name] for name in ("monthly_rent", "deposit_law", "late_fee_300")]
+
+# Timed in benchmark_query_speed
+SPEED = [SHARED[name] for name in ("late_fee_300", "max_deposit", "monthly_rent")]
+
+# Graded in benchmark_quality_distribution
+QUALITY = [
+    SHARED[name][0]
+    for name in ("monthly_rent", "pets", "deposit_law", "late_fee_300", "entry_notice")
+]
@@ -0,0 +1,74 @@
+"""
+Approximate (semantic) result cache for test queries
+
+Reuses a stored result when a new query's embedding is within a cosine
+distance threshold of one already answered, e.g. "Is my $300 late fee
+legal?" vs "Can my landlord charge a $300 late fee?".
+"""
+
+from typing import Any, Callable, List, Optional, Tuple
+
+import numpy as np
+
+class ProximityCache:
+    """LRU cache keyed by query embedding, matched on cosine distance"""
+
+    def __init__(
+        self,
+        embed: Callable[[str], List[float]],
+        threshold: float = 0.03,
+        capacity: int = 64
+    ):
+        """
+        Args:
+            embed: Function mapping a query to its embedding vector
+            threshold: Max cosine distance (1 - cosine similarity) for a hit
+            capacity: Max entries kept; least recently used is evicted
+        """
+        self.embed = embed
+        self.threshold = threshold
+        self.capacity = capacity
+        self._vectors = []
+        self._values = []
+
+    def _unit(self, query: str) -> np.ndarray:
+        vector = np.asarray(self.embed(query), dtype=np.float32)
+        return vector / np.linalg.norm(vector)
+
+    def lookup(self, query: str) -> Tuple[np.ndarray, Optional[Any]]:
+        """
+        Find a cached result for a semantically close query.
+
+        Returns:
+            (query unit vector, cached value or None on a miss)
+        """
+        vector = self._unit(query)
+        if not self._vectors:
+            return vector, None
+
+        # All distances in one matmul over the stacked keys
+        distances = 1.0 - np.stack(self._vectors) @ vector
+        best = int(np.argmin(distances))
+        if distances[best] > self.threshold:
+            return vector, None
+
+        # Mark as most recently used
+        self._vectors.append(self._vectors.pop(best))
+        self._values.append(self._values.pop(best))
+        return vector, self._values[-1]
+
+    def insert(self, vector: np.ndarray, value: Any):
+        """Store a result under a unit vector returned by lookup()"""
+        if len(self._vectors) >= self.capacity:
+            self._vectors.pop(0)
+            self._values.pop(0)
+        self._vectors.append(vector)
+        self._values.append(value)
+
+    def get_or_compute(self, query: str, compute: Callable[[], Any]) -> Any:
+        """Return the cached result for a close query, else compute and store it"""
+        vector, value = self.lookup(query)
+        if value is None:
+            value = compute()
+            self.insert(vector, value)
+        return value
@@ -0,0 +1,31 @@
+"""
+One-time warmup for tests and benchmarks
+
+Pays import, client setup and connection costs up front so the first
+timed query isn't measuring a cold start.
+"""
+
+def warmup(collection_name: str = "test_lease_phase1"):
+    """
+    Import the pipeline, compile the graph and run one tiny retrieval.
+
+    Best effort: a missing collection or API key only skips the rest. A
+    missing collection is never searched, since opening it would create
+    it empty.
+
+    Args:
+        collection_name: Existing lease collection to search once
+    """
+    try:
+        from src.agents.supervisor import get_graph
+        from src.tools.embeddings import get_vector_store_manager
+
+        get_graph()
+        vsm = get_vector_store_manager()
+        if not vsm.collection_exists(collection_name):
+            print(f"⚠️  Warmup skipped retrieval: '{collection_name}' does not exist")
+            return
+        vsm.search_lease("warmup", collection_name, k=1)
+        print("✓ Warmup complete")
+    except Exception as e:
+        print(f"⚠️  Warmup skipped: {e}")
@@ -0,0 +1,42 @@
+import os
+
+import pytest
+
+try:
+    import vcr
+    VCR_AVAILABLE = True
+except ImportError:
+    VCR_AVAILABLE = False
+
+# Modules whose OpenAI traffic is recorded to tests/cassettes/<module>.yaml
+# and replayed on later runs (pip install vcrpy; LEASELOGIC_VCR=0 disables).
+# Requests are matched on their body too, so concurrent queries each get
+# their own response. A cassette is only written when it does not exist yet:
+# after changing a prompt, model or test query, delete the module's cassette
+# to re-record it. CI should set LEASELOGIC_VCR_RECORD=none so an unrecorded
+# request fails instead of reaching the API.
+VCR_MODULES = {"test_phase3", "test_phase4", "test_phase5"}
+CASSETTE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cassettes")
+VCR_MATCH_ON = ["method", "scheme", "host", "port", "path", "query", "body"]
+
+def pytest_configure(config):
+    """Register the markers used to split quick and slow tests"""
+    config.addinivalue_line("markers", "quick: uses existing vector stores")
+    config.addinivalue_line("markers", "slow: processes PDFs from scratch")
+    config.addinivalue_line("markers", "network: calls the OpenAI API (skip offline with -m 'not network')")
+
+@pytest.fixture(autouse=True, scope="module")
+def vcr_cassette(request):
+    """Replay recorded LLM/embedding HTTP calls; new requests are recorded"""
+    module = request.module.__name__.rsplit(".", 1)[-1]
+    if not VCR_AVAILABLE or module not in VCR_MODULES or os.getenv("LEASELOGIC_VCR") == "0":
+        yield
+        return
+    
+    with vcr.use_cassette(
+        os.path.join(CASSETTE_DIR, f"{module}.yaml"),
+        record_mode=os.getenv("LEASELOGIC_VCR_RECORD", "once"),
+        match_on=VCR_MATCH_ON,
+        filter_headers=["authorization"]
+    ):
+        yield
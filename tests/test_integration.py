@@ -1,11 +1,15 @@
-import os
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import re
+
+import pytest
 
 from src.tools.pdf_processor import LeaseDocumentProcessor
-from src.tools.embeddings import VectorStoreManager
+from src.tools.embeddings import get_vector_store_manager
 from src.agents.supervisor import run_analysis
+from tests._analysis_cache import cached_run_analysis, cached_run_analysis_batch
+from tests._collections import LEASE_COLLECTION, require_collections
+from tests._queries import CLASSIFICATION, SHARED
 
+@pytest.mark.slow
 def test_full_pipeline():
     """Test complete pipeline: PDF → Analysis → Answer"""
     print("=" * 60)
@@ -21,14 +25,14 @@ def test_full_pipeline():
 
     # Step 2: Create vector store
     print("\n2. Creating vector store...")
-    vsm = VectorStoreManager()
+    vsm = get_vector_store_manager()
     collection_name = "integration_test_lease"
     vsm.create_lease_vectorstore(chunks, collection_name)
     print(f"✓ Vector store '{collection_name}' created")
 
     # Step 3: Run analysis
     print("\n3. Running multi-agent analysis...")
-    result = run_analysis(
+    result = cached_run_analysis(
         user_query="Can my landlord charge a $300 late fee?",
         lease_collection_name=collection_name,
         state_location="california"
@@ -56,26 +60,25 @@ def test_full_pipeline():
     print("✅ INTEGRATION TEST PASSED")
     print("=" * 60)
 
+@pytest.mark.quick
 def test_query_classification():
     """Test intelligent query routing"""
     print("\n" + "=" * 60)
     print("INTEGRATION TEST: Query Classification")
     print("=" * 60)
 
-    test_cases = [
-        ("What is my monthly rent?", "lease_only"),
-        ("What does California law say about deposits?", "law_only"),
-        ("Is my $300 late fee legal?", "both"),
-    ]
+    require_collections(LEASE_COLLECTION, "california_laws")
 
-    for query, expected_scope in test_cases:
-        print(f"\nQuery: {query}")
-        result = run_analysis(
-            user_query=query,
-            lease_collection_name="test_lease_phase1",
-            state_location="california"
-        )
+    test_cases = CLASSIFICATION
+
+    results = cached_run_analysis_batch(
+        [query for query, _ in test_cases],
+        lease_collection_name="test_lease_phase1",
+        state_location="california"
+    )
 
+    for (query, expected_scope), result in zip(test_cases, results):
+        print(f"\nQuery: {query}")
         actual_scope = result.get('query_scope', 'both')
         print(f"  Expected scope: {expected_scope}")
         print(f"  Actual scope: {actual_scope}")
@@ -90,6 +93,7 @@ def test_query_classification():
 
     print("\n✅ Query classification test passed!")
 
+@pytest.mark.quick
 def test_multi_state_support():
     """Test that different states work"""
     print("\n" + "=" * 60)
@@ -97,72 +101,53 @@ def test_multi_state_support():
     print("=" * 60)
 
     states = ["california", "new_york", "texas"]
+    require_collections(LEASE_COLLECTION, *(f"{state}_laws" for state in states))
 
     for state in states:
         print(f"\nTesting {state.title()}...")
-        result = run_analysis(
-            user_query="What is the maximum security deposit?",
+        result = cached_run_analysis(
+            user_query=SHARED["max_deposit"][0],
             lease_collection_name="test_lease_phase1",
             state_location=state
         )
 
         # Check that state name appears in answer
-        answer_lower = result['final_answer'].lower()
-        assert state.lower() in answer_lower or state.replace('_', ' ') in answer_lower, \
-            f"State {state} not mentioned in answer"
+        assert re.search(
+            rf"\b{re.escape(state.replace('_', ' '))}\b|\b{re.escape(state)}\b",
+            result['final_answer'], re.IGNORECASE
+        ), f"State {state} not mentioned in answer"
 
         print(f"✓ {state.title()} analysis complete")
 
     print("\n✅ Multi-state test passed!")
 
+@pytest.mark.quick
 def test_error_handling():
     """Test system handles errors gracefully"""
     print("\n" + "=" * 60)
     print("INTEGRATION TEST: Error Handling")
     print("=" * 60)
 
-    # Test with non-existent collection
-    try:
-        result = run_analysis(
+    vsm = get_vector_store_manager()
+
+    # Older runs could have created this collection empty by searching it
+    if "nonexistent_collection" in vsm.list_collections():
+        vsm.delete_collection("nonexistent_collection")
+
+    # A missing lease collection fails fast, before any LLM call
+    with pytest.raises(LookupError) as excinfo:
+        run_analysis(
             user_query="Test question",
             lease_collection_name="nonexistent_collection",
             state_location="california"
         )
-        print("⚠️ Should have raised error for nonexistent collection")
-    except Exception as e:
-        print(f"✓ Correctly raised error: {type(e).__name__}")
+    print(f"✓ Correctly raised error: {excinfo.value}")
 
-    print("\n✅ Error handling test passed!")
+    # Searching it directly fails the same way
+    with pytest.raises(LookupError):
+        vsm.search_lease("Test question", collection_name="nonexistent_collection")
 
-if __name__ == "__main__":
-    import argparse
-
-    parser = argparse.ArgumentParser(description='Run integration tests')
-    parser.add_argument('--full', action='store_true',
-                       help='Run full pipeline test (slow - processes PDF)')
-    parser.add_argument('--quick', action='store_true',
-                       help='Run quick tests only (use existing vectorstore)')
-    args = parser.parse_args()
-
-    if args.full:
-        # Run all tests including the slow PDF processing one
-        test_full_pipeline()
-        test_query_classification()
-        test_multi_state_support()
-        test_error_handling()
-    elif args.quick:
-        # Skip the slow PDF test
-        print("Running quick tests (skipping PDF processing)...\n")
-        test_query_classification()
-        test_multi_state_support()
-        test_error_handling()
-    else:
-        # Default: run quick tests
-        print("Running quick tests. Use --full to include PDF processing test\n")
-        test_query_classification()
-        test_multi_state_support()
-        test_error_handling()
+    # Neither attempt may leave an (empty) collection behind
+    assert "nonexistent_collection" not in vsm.list_collections()
 
-    print("\n" + "=" * 60)
-    print("✅ ALL INTEGRATION TESTS PASSED")
-    print("=" * 60)
\ No newline at end of file
+    print("\n✅ Error handling test passed!")
@@ -6,20 +6,32 @@ to verify intelligent routing optimization.
 """
 
 import os
-import sys
+import statistics
 import time
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.agents.supervisor import run_analysis
+from src.chains.corrective_rag import _grader_response
+from src.tools.embeddings import get_vector_store_manager
+from tests._analysis_cache import (
+    cached_run_analysis,
+    cached_run_analysis_batch,
+    record_results,
+    replay_results,
+)
+from tests._queries import QUALITY, SPEED
+from tests._warmup import warmup
+
+# Timed runs per query in benchmark_query_speed (each is a full pipeline run)
+BENCHMARK_REPS = int(os.getenv("BENCHMARK_REPS", "1"))
+
+def clear_pipeline_caches():
+    """Drop cached query embeddings and grades so each rep runs the full pipeline"""
+    get_vector_store_manager().embed_query.cache_clear()
+    _grader_response.cache_clear()
 
 def benchmark_query_speed():
     """Measure average query response time"""
 
-    queries = [
-        ("Can my landlord charge a $300 late fee?", "both"),
-        ("What is the maximum security deposit?", "law_only"),
-        ("What is my monthly rent?", "lease_only"),
-    ]
+    queries = SPEED
 
     times = []
     results = []
@@ -31,16 +43,23 @@ def benchmark_query_speed():
     for query, expected_scope in queries:
         print(f"\nQuery: {query}")
         print(f"Expected scope: {expected_scope}")
-        start = time.time()
 
-        result = run_analysis(
-            user_query=query,
-            lease_collection_name="test_lease_phase1",
-            state_location="california"
-        )
-
-        elapsed = time.time() - start
-        times.append(elapsed)
+        # Always run for real so the timing is meaningful; the result is
+        # stored for the quality benchmark
+        samples = []
+        for _ in range(BENCHMARK_REPS):
+            clear_pipeline_caches()
+            start = time.perf_counter_ns()
+            result = cached_run_analysis(
+                user_query=query,
+                lease_collection_name="test_lease_phase1",
+                state_location="california",
+                refresh=True
+            )
+            samples.append((time.perf_counter_ns() - start) / 1e9)
+
+        elapsed = statistics.median(samples)
+        times.extend(samples)
         results.append({
             'query': query,
             'expected_scope': expected_scope,
@@ -60,12 +79,16 @@ def benchmark_query_speed():
         if result.get('query_scope') in ['lease_only', 'law_only']:
             print(f"[✓] Optimized query (skipped irrelevant search)")
 
+    # Percentiles are less sensitive than min/max to a single slow LLM call
     avg_time = sum(times) / len(times)
+    p50 = statistics.median(times)
+    p95 = statistics.quantiles(times, n=20, method="inclusive")[18] if len(times) > 1 else times[0]
     print(f"\n{'='*60}")
     print(f"PERFORMANCE SUMMARY")
     print(f"{'='*60}")
+    print(f"Samples: {len(times)} ({BENCHMARK_REPS} per query, set BENCHMARK_REPS for more)")
     print(f"Average query time: {avg_time:.2f}s")
-    print(f"Min: {min(times):.2f}s | Max: {max(times):.2f}s")
+    print(f"p50: {p50:.2f}s | p95: {p95:.2f}s")
     print(f"{'='*60}")
 
     # Breakdown by query type
@@ -93,13 +116,7 @@ def benchmark_query_speed():
 def benchmark_quality_distribution():
     """Measure retrieval quality distribution"""
 
-    queries = [
-        "What is my monthly rent?",
-        "Can I have pets?",
-        "What does California law say about security deposits?",
-        "Is my late fee legal?",
-        "How much notice for landlord entry?"
-    ]
+    queries = QUALITY
 
     qualities = []
 
@@ -107,13 +124,15 @@ def benchmark_quality_distribution():
     print("QUALITY BENCHMARK: Retrieval Accuracy")
     print("=" * 60)
 
-    for query in queries:
-        result = run_analysis(
-            user_query=query,
-            lease_collection_name="test_lease_phase1",
-            state_location="california"
-        )
+    # Queries are independent and network-bound, so run them as one
+    # concurrent batch
+    results = cached_run_analysis_batch(
+        queries,
+        lease_collection_name="test_lease_phase1",
+        state_location="california"
+    )
 
+    for query, result in zip(queries, results):
         quality = result.get('retrieval_quality_grade', 0)
         qualities.append(quality)
 
@@ -183,14 +202,33 @@ def benchmark_cost_estimation():
     print(f"\n[OK] Cost benchmark complete!")
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Run performance benchmarks')
+    parser.add_argument('--record', metavar='FILE',
+                       help='Save run_analysis results to FILE for --replay')
+    parser.add_argument('--replay', metavar='FILE',
+                       help='Report from results saved with --record (no LLM calls)')
+    args = parser.parse_args()
+
     print("\nNOTE: These benchmarks use the existing 'test_lease_phase1' collection")
     print("If that doesn't exist, run test_phase1.py first\n")
 
-    # Run benchmarks
-    benchmark_query_speed()
+    if args.replay:
+        # Replayed results carry no timing, so only the reports are regenerated
+        replay_results(args.replay)
+        print("Skipping speed benchmark (replaying recorded results)")
+    else:
+        # Keep cold-start costs out of the first timed query
+        warmup()
+        benchmark_query_speed()
+
     benchmark_quality_distribution()
     benchmark_cost_estimation()
 
+    if args.record:
+        record_results(args.record)
+
     print("\n" + "=" * 60)
     print("[OK] ALL PERFORMANCE BENCHMARKS COMPLETE")
     print("=" * 60)
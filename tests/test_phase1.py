@@ -1,28 +1,34 @@
 import os
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
 
 from src.tools.pdf_processor import LeaseDocumentProcessor
-from src.tools.embeddings import VectorStoreManager
+from src.tools.embeddings import get_vector_store_manager
+from tests._collections import LEASE_COLLECTION, require_collections
 
-def test_pdf_processing():
-    """Test PDF extraction and chunking"""
-    print("=" * 60)
-    print("TEST 1: PDF Processing")
-    print("=" * 60)
-    
-    sample_pdf = "data/leases/sample_lease.pdf"
-    
-    if not os.path.exists(sample_pdf):
-        print(f"❌ Sample PDF not found at {sample_pdf}")
-        print("   Download a sample lease from https://eforms.com/rental/ca/")
-        return None
+SAMPLE_PDF = "data/leases/sample_lease.pdf"
+
+@pytest.fixture(scope="module")
+def chunks():
+    """Processed chunks of the sample lease, shared by the tests below"""
+    if not os.path.exists(SAMPLE_PDF):
+        pytest.skip(
+            f"Sample PDF not found at {SAMPLE_PDF} "
+            "(download a sample lease from https://eforms.com/rental/ca/)"
+        )
     
     processor = LeaseDocumentProcessor()
-    chunks = processor.process_lease_pdf(
-        sample_pdf,
+    return processor.process_lease_pdf(
+        SAMPLE_PDF,
         lease_metadata={"state": "california", "lease_type": "residential"}
     )
+
+@pytest.mark.slow
+def test_pdf_processing(chunks):
+    """Test PDF extraction and chunking"""
+    print("=" * 60)
+    print("TEST 1: PDF Processing")
+    print("=" * 60)
     
     print(f"\n✓ Extracted {len(chunks)} chunks")
     print(f"✓ Sample chunk metadata: {chunks[0]['metadata']}")
@@ -36,19 +42,15 @@ def test_pdf_processing():
     assert all('text' in c and 'metadata' in c for c in chunks), "Invalid chunk structure"
     
     print("\n✅ PDF processing test passed!")
-    return chunks
 
+@pytest.mark.slow
 def test_vector_store(chunks):
     """Test vector store creation and search"""
     print("\n" + "=" * 60)
     print("TEST 2: Vector Store")
     print("=" * 60)
     
-    if chunks is None:
-        print("⏭️  Skipping (no chunks from previous test)")
-        return
-    
-    vsm = VectorStoreManager()
+    vsm = get_vector_store_manager()
     
     # Create vector store
     vectorstore = vsm.create_lease_vectorstore(chunks, "test_lease_phase1")
@@ -64,9 +66,8 @@ def test_vector_store(chunks):
     ]
     
     print("\nTesting searches:")
-    for query in test_queries:
-        results = vsm.search_lease(query, "test_lease_phase1", k=2)
-        
+    batch_results = vsm.search_lease_batch(test_queries, "test_lease_phase1", k=2)
+    for query, results in zip(test_queries, batch_results):
         print(f"\n  Query: {query}")
         if results:
             print(f"    Top result section: {results[0]['metadata']['section']}")
@@ -79,13 +80,16 @@ def test_vector_store(chunks):
     # Cleanup
     # vsm.delete_collection("test_lease_phase1")
 
+@pytest.mark.quick
 def test_metadata_filtering():
     """Test metadata filtering in search"""
     print("\n" + "=" * 60)
     print("TEST 3: Metadata Filtering")
     print("=" * 60)
     
-    vsm = VectorStoreManager()
+    require_collections(LEASE_COLLECTION)
+    
+    vsm = get_vector_store_manager()
     
     try:
         # Search only in rent section
@@ -106,16 +110,3 @@ def test_metadata_filtering():
         
     except Exception as e:
         print(f"⚠️  Metadata filtering test skipped: {e}")
-
-if __name__ == "__main__":
-    print("LeaseLogic - Phase 1 Testing")
-    print("=" * 60)
-    
-    chunks = test_pdf_processing()
-    test_vector_store(chunks)
-    test_metadata_filtering()
-    
-    print("\n" + "=" * 60)
-    print("✅ PHASE 1 COMPLETE!")
-    print("=" * 60)
-    print("\nNext: Phase 2 - Build state law corpus")
\ No newline at end of file
@@ -1,8 +1,6 @@
-import os
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import asyncio
 
-from src.chains.rag_chain import LeaseRAG, LawRAG
+from src.chains.rag_chain import get_lease_rag, get_law_rag
 
 def test_lease_rag():
     """Test lease RAG chain"""
@@ -11,7 +9,7 @@ def test_lease_rag():
     print("=" * 60)
     
     try:
-        lease_rag = LeaseRAG("test_lease_phase1")
+        lease_rag = get_lease_rag("test_lease_phase1")
         
         test_queries = [
             "What is the monthly rent?",
@@ -19,9 +17,10 @@ def test_lease_rag():
             "Can I have pets?"
         ]
         
-        for query in test_queries:
+        results = asyncio.run(lease_rag.run_many(test_queries))
+        
+        for query, result in zip(test_queries, results):
             print(f"\nQuery: {query}")
-            result = lease_rag.run(query)
             
             print(f"  Retrieved: {len(result['retrieved_docs'])} docs")
             print(f"  Score: {result['retrieval_score']:.3f}")
@@ -41,7 +40,7 @@ def test_law_rag():
     print("=" * 60)
     
     try:
-        law_rag = LawRAG("california")
+        law_rag = get_law_rag("california")
         
         test_queries = [
             "Can landlord charge a $300 late fee?",
@@ -49,9 +48,10 @@ def test_law_rag():
             "What is maximum security deposit?"
         ]
         
-        for query in test_queries:
+        results = asyncio.run(law_rag.run_many(test_queries))
+        
+        for query, result in zip(test_queries, results):
             print(f"\nQuery: {query}")
-            result = law_rag.run(query)
             
             print(f"  Retrieved: {len(result['retrieved_docs'])} sections")
             print(f"  Score: {result['retrieval_score']:.3f}")
@@ -74,8 +74,8 @@ def test_combined_analysis():
     print("=" * 60)
     
     try:
-        lease_rag = LeaseRAG("test_lease_phase1")
-        law_rag = LawRAG("california")
+        lease_rag = get_lease_rag("test_lease_phase1")
+        law_rag = get_law_rag("california")
         
         query = "Can my landlord charge a $300 late fee?"
         
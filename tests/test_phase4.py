@@ -1,8 +1,4 @@
-import os
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from src.chains.rag_chain import LawRAG
+from src.chains.rag_chain import get_law_rag
 from src.chains.corrective_rag import RetrievalGrader, QueryRefiner, CorrectiveRAG
 
 def test_retrieval_grader():
@@ -81,7 +77,7 @@ def test_corrective_rag_iteration():
     print("TEST 3: Corrective RAG Iteration")
     print("=" * 60)
     
-    law_rag = LawRAG("california")
+    law_rag = get_law_rag("california")
     corrective = CorrectiveRAG(law_rag, max_iterations=3)
     
     # Use intentionally vague query that should trigger refinement
@@ -102,7 +98,7 @@ def test_quality_threshold():
     print("TEST 4: Quality Threshold")
     print("=" * 60)
     
-    law_rag = LawRAG("california")
+    law_rag = get_law_rag("california")
     corrective = CorrectiveRAG(law_rag)
     
     # Use specific query that should get good results immediately
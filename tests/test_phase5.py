@@ -1,8 +1,15 @@
-import os
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import asyncio
+import re
 
-from src.agents.supervisor import build_graph, run_analysis
+from src.agents.supervisor import build_graph, run_analysis, run_analysis_async
+
+# (query pattern, answer pattern): an answer is relevant if it matches the
+# answer pattern of the first entry whose query pattern matches the query
+RELEVANCE = [
+    (re.compile(r"late fee", re.I), re.compile(r"late|fee", re.I)),
+    (re.compile(r"enter", re.I), re.compile(r"entry|enter|notice", re.I)),
+    (re.compile(r"security deposit", re.I), re.compile(r"deposit|security", re.I)),
+]
 
 def test_graph_construction():
     """Test that graph builds without errors"""
@@ -106,30 +113,39 @@ def test_end_to_end_queries():
         "What is the maximum security deposit in California?",
     ]
     
+    async def run_all():
+        # Queries are independent, so their graphs run concurrently
+        return await asyncio.gather(
+            *[
+                run_analysis_async(
+                    user_query=query,
+                    lease_collection_name="test_lease_phase1",
+                    state_location="california"
+                )
+                for query in test_queries
+            ],
+            return_exceptions=True
+        )
+    
     results = []
     
-    for query in test_queries:
+    for query, result in zip(test_queries, asyncio.run(run_all())):
         print(f"\n--- Testing: {query} ---")
         
         try:
-            result = run_analysis(
-                user_query=query,
-                lease_collection_name="test_lease_phase1",
-                state_location="california"
-            )
+            if isinstance(result, Exception):
+                raise result
             
-            # Check that answer addresses the query
-            answer_lower = result['final_answer'].lower()
-            
-            # Basic relevance checks
-            if "late fee" in query.lower():
-                relevant = "late" in answer_lower or "fee" in answer_lower
-            elif "enter" in query.lower():
-                relevant = "entry" in answer_lower or "enter" in answer_lower or "notice" in answer_lower
-            elif "security deposit" in query.lower():
-                relevant = "deposit" in answer_lower or "security" in answer_lower
-            else:
-                relevant = True  # Skip check for other queries
+            # Check that answer addresses the query (queries without a
+            # pattern skip the check)
+            relevant = next(
+                (
+                    answer_re.search(result['final_answer']) is not None
+                    for query_re, answer_re in RELEVANCE
+                    if query_re.search(query)
+                ),
+                True
+            )
             
             if relevant:
                 print(f"✓ Answer appears relevant")
@@ -1,28 +1,33 @@
+import hashlib
+import importlib
 import sys
 import os
+import time
+
+import pytest
+
+# module -> display name
+REQUIRED_MODULES = {
+    "langchain": "LangChain",
+    "langgraph": "LangGraph",
+    "chromadb": "ChromaDB",
+    "streamlit": "Streamlit",
+    "openai": "OpenAI",
+    "langchain_openai": "LangChain-OpenAI",
+}
+
+# A successful key check is remembered for a day, per API key
+OPENAI_PROBE_CACHE = os.path.expanduser("~/.cache/leaselogic/openai_probe.ts")
+OPENAI_PROBE_TTL = 24 * 60 * 60
 
 def test_imports():
     """Test that all required packages can be imported"""
     print("Testing imports...")
     
     try:
-        import langchain
-        print("✓ LangChain")
-        
-        import langgraph
-        print("✓ LangGraph")
-        
-        import chromadb
-        print("✓ ChromaDB")
-        
-        import streamlit
-        print("✓ Streamlit")
-        
-        import openai
-        print("✓ OpenAI")
-        
-        from langchain_openai import ChatOpenAI, OpenAIEmbeddings
-        print("✓ LangChain-OpenAI")
+        for module, name in REQUIRED_MODULES.items():
+            importlib.import_module(module)
+            print(f"✓ {name}")
         
         print("\n✅ All imports successful!")
         return True
@@ -58,20 +63,37 @@ def test_environment():
     
     return all_set
 
+@pytest.mark.network
 def test_openai_connection():
     """Test OpenAI API connection"""
     print("\nTesting OpenAI connection...")
     
     try:
-        from langchain_openai import ChatOpenAI
         from dotenv import load_dotenv
         load_dotenv()
         
-        llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
-        response = llm.invoke("Say 'Hello from LeaseLogic setup!'")
+        key_hash = hashlib.sha256(os.getenv("OPENAI_API_KEY", "").encode()).hexdigest()
+        
+        try:
+            with open(OPENAI_PROBE_CACHE) as f:
+                cached_hash = f.read().strip()
+            age = time.time() - os.path.getmtime(OPENAI_PROBE_CACHE)
+        except OSError:
+            cached_hash, age = None, None
+        
+        if cached_hash == key_hash and age < OPENAI_PROBE_TTL:
+            print(f"✓ OpenAI API connected (verified {age / 3600:.1f}h ago)")
+            return True
+        
+        # Listing models validates the key without spending any tokens
+        import openai
+        openai.OpenAI().models.list()
+        
+        os.makedirs(os.path.dirname(OPENAI_PROBE_CACHE), exist_ok=True)
+        with open(OPENAI_PROBE_CACHE, "w") as f:
+            f.write(key_hash)
         
         print(f"✓ OpenAI API connected")
-        print(f"  Response: {response.content}")
         return True
         
     except Exception as e: